@@ -1,6 +1,85 @@
+import pandas as pd
 import streamlit as st 
+from analytics import warmup
+from analytics.charts import pyplot_png
+from analytics.compare import QUADRANT_AXES, opponents, percentiles, quadrants, rankings
+from analytics.figures import draw_player_trend, draw_quadrant
+from analytics.query import DIMENSIONS, aggregate, load_query_index, select
+from analytics.season import season_metrics, season_player_totals
+from analytics.trends import last_n_games, load_player_trends
+from analytics.value import season_values
 
+st.set_page_config(layout='wide')
+warmup.start()
+
+warming = warmup.status()['started'] is not None and warmup.status()['finished'] is None
+
+
+@st.fragment(run_every=1 if warming else None)
+def warmup_status():
+    # Polls the background warmup until every game page is served from cache
+    status = warmup.status()
+    if status['started'] is None:
+        return
+    if warming and status['finished'] is not None:
+        # Full rerun so the fragment stops polling
+        st.rerun()
+    if status['finished'] is None:
+        st.progress(status['done']/max(status['total'],1), text=f"warming caches: {status['done']}/{status['total']} games")
+    else:
+        st.caption(f"caches warm: {status['total']} games in {status['finished']-status['started']:.1f}s")
+    for game, error in status['failed'].items():
+        st.warning(f'warmup failed for {game}: {error}')
 
 st.header('Season Dashboard in progress...')
+warmup_status()
+
+games_tab, players_tab, trends_tab, query_tab = st.tabs(['games','players','player trends','query'])
+
+with games_tab:
+    # Rankings, percentiles and quadrants all come from the one games x metrics matrix
+    matrix = season_metrics()
+    view = st.radio('view', ['values','ranks','percentiles'], horizontal=True, key='games_view', label_visibility='collapsed')
+    if view == 'values':
+        table = matrix.join(season_values())
+    elif view == 'ranks':
+        table = rankings(matrix)
+    else:
+        table = percentiles(matrix)
+    st.dataframe(pd.concat([opponents(matrix), quadrants(matrix).rename('quadrant'), table.round(2)], axis=1), use_container_width=True)
+    cols = st.columns([0.5,0.5])
+    with cols[0]:
+        # Quadrant plot: defense isn't tracked yet, so x is yards per play instead of total defense
+        if len(matrix):
+            st.image(pyplot_png(draw_quadrant, matrix[list(QUADRANT_AXES)], opponents(matrix)), use_container_width=True)
+
+with players_tab:
+    st.dataframe(season_player_totals(), use_container_width=True)
+
+with trends_tab:
+    trends = load_player_trends()
+    cols = st.columns([0.3,0.7])
+    with cols[0]:
+        player = st.selectbox('player', trends['player'].unique().tolist())
+        trend = trends[trends['player']==player]
+        played = trend['game'].nunique()
+        n_games = st.slider('last N games', 1, played, played) if played > 1 else played
+    with cols[1]:
+        # No player to pick until the first log lands
+        if player is None:
+            st.info('No plays logged yet')
+        else:
+            trend = last_n_games(trend, n_games)
+            st.image(pyplot_png(draw_player_trend, trend[['seq','expanding','rolling']], player), use_container_width=True)
 
-# TO DO : Graph 4 quadrant plot (x axis: total defense) (y axis: efficient ball movement %)
+with query_tab:
+    # Any slice of the season: values within a filter are OR'd, filters are AND'd
+    index = load_query_index()
+    cols = st.columns([0.3,0.7])
+    with cols[0]:
+        filters = {dim: st.multiselect(dim, list(index['bitmaps'][dim]), key='query_'+dim) for dim in DIMENSIONS}
+        by = st.multiselect('group by', DIMENSIONS, key='query_by')
+    with cols[1]:
+        rows = select(index, **filters)
+        st.caption(f'{len(rows)} plays')
+        st.dataframe(aggregate(index, rows, by).round(2), use_container_width=True)
@@ -0,0 +1,17 @@
+from analytics.bootstrap import load_player_intervals, load_team_intervals, player_intervals, team_intervals
+from analytics.charts import create_semi_circular_gauge, fingerprint, pyplot_png, render_cache
+from analytics.compare import compute_metric_matrix, percentiles, rankings
+from analytics.drives import compute_drives, drive_summary, load_drives
+from analytics.headshots import headshot_html, publish_thumbnail
+from analytics.loader import cache_stats, derived, load_plays
+from analytics.metrics import TEAM_METRICS, compute_team_metrics, efficient_mask, is_efficient, load_team_metrics, play_terms
+from analytics.players import PLAYER_STATS, compute_player_stats, load_player_stats
+from analytics.query import DIMENSIONS, build_index, load_query_index
+from analytics.roster import ACTIONS, ROSTER, encode_plays, player_id, roster_table, starting_qb
+from analytics.schema import PLAY_COLUMNS, PLAY_DTYPES
+from analytics.season import game_id, load_season, play_logs, season_metrics, season_player_totals
+from analytics.series import compute_team_series, load_team_series
+from analytics.situations import TERRITORIES, compute_situations, load_situations, situation_captions, situation_table
+from analytics.trends import POINT_BUDGET, compute_player_trends, downsample, last_n_games, load_player_trends
+from analytics.validate import PlayLogError, read_play_log
+from analytics.value import fit_value_model, game_values, load_value_model, play_values, season_values, situation_index
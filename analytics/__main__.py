@@ -0,0 +1,54 @@
+import argparse
+import glob
+import sys
+
+from analytics import bench, export, store
+from analytics.validate import PlayLogError
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m analytics')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='convert csv play logs into the columnar store')
+    ingest.add_argument('paths', nargs='*', help='play logs (default: ./data/*-PLAYS)')
+    ingest.add_argument('--store-dir', default=None)
+    ingest.add_argument('--chunksize', type=int, default=None, help='rows validated at a time')
+    ingest.add_argument('--check', action='store_true', help='validate only, write nothing')
+
+    report = commands.add_parser('export', help='render game reports to static html/png without streamlit')
+    report.add_argument('paths', nargs='*', help='play logs (default: ./data/*-PLAYS)')
+    report.add_argument('--out-dir', default=export.EXPORT_DIR)
+    report.add_argument('--workers', type=int, default=None, help='worker processes (default: one per core)')
+
+    timing = commands.add_parser('bench', help='time each pipeline stage on synthetic play logs')
+    timing.add_argument('--sizes', nargs='+', type=int, default=bench.SIZES)
+    timing.add_argument('--repeats', type=int, default=bench.REPEATS)
+    timing.add_argument('--seed', type=int, default=0)
+    timing.add_argument('--out', default='bench.json', help='json report path')
+
+    args = parser.parse_args(argv)
+    if args.command == 'ingest':
+        written, rejected = store.ingest(args.paths or sorted(glob.glob('./data/*-PLAYS')), args.store_dir, args.chunksize, args.check)
+        for path in written:
+            print(path)
+        for error in rejected.values():
+            print(error, file=sys.stderr)
+        if rejected:
+            sys.exit(1)
+    elif args.command == 'export':
+        written, rejected = export.export_games(args.paths or sorted(glob.glob('./data/*-PLAYS')), args.out_dir, args.workers)
+        for path in written:
+            print(path)
+        for path, error in rejected.items():
+            print(error if isinstance(error, PlayLogError) else f'{path}: {error!r}', file=sys.stderr)
+        if rejected:
+            sys.exit(1)
+    elif args.command == 'bench':
+        report = bench.run(args.sizes, args.repeats, args.seed)
+        print(bench.summary(report))
+        print(bench.write_report(report, args.out))
+
+
+if __name__ == '__main__':
+    main()
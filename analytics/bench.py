@@ -0,0 +1,90 @@
+import json
+import os
+import platform
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from analytics import store
+from analytics.charts import pyplot_png, render_cache
+from analytics.figures import draw_team_graph
+from analytics.loader import parse_csv
+from analytics.metrics import compute_team_metrics
+from analytics.players import compute_player_stats
+from analytics.roster import starting_qb
+from analytics.series import compute_team_series
+from analytics.situations import compute_situations
+from analytics.synthetic import write_synthetic_log
+
+SIZES = [10 ** 2, 10 ** 4, 10 ** 6]
+
+REPEATS = 3
+
+
+def _render(series):
+    # Always a cold render, the cache would otherwise hide the cost
+    render_cache.clear()
+    return pyplot_png(draw_team_graph, series)
+
+
+def _best_of(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def bench_size(rows, workdir, repeats=REPEATS, seed=0):
+    """Time each pipeline stage on one synthetic log of `rows` plays."""
+    csv_path = write_synthetic_log(os.path.join(workdir, f'SYN-{rows}-PLAYS'), rows, seed)
+
+    stages = {}
+    stages['load_csv'], plays = _best_of(lambda: parse_csv(csv_path), repeats)
+    store.write_store(plays, csv_path, workdir)
+    stages['load_store'], _ = _best_of(lambda: store.read_store(csv_path, workdir), repeats)
+    stages['team_metrics'], _ = _best_of(lambda: compute_team_metrics(plays), repeats)
+    stages['player_stats'], _ = _best_of(lambda: compute_player_stats(plays, starting_qb()), repeats)
+    stages['situations'], _ = _best_of(lambda: compute_situations(plays), repeats)
+    stages['team_series'], series = _best_of(lambda: compute_team_series(plays), repeats)
+    stages['render_team_graph'], _ = _best_of(lambda: _render(series), repeats)
+
+    return {
+        'rows': rows,
+        'csv_bytes': os.path.getsize(csv_path),
+        'seconds': {stage: round(seconds, 6) for stage, seconds in stages.items()},
+    }
+
+
+def run(sizes=SIZES, repeats=REPEATS, seed=0):
+    """Benchmark report for every size, as a json-serializable dict."""
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [bench_size(rows, workdir, repeats, seed) for rows in sizes]
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'repeats': repeats,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def write_report(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def summary(report):
+    """Plain-text table of a report, one row per size."""
+    stages = list(report['results'][0]['seconds']) if report['results'] else []
+    lines = ['rows'.rjust(10) + ''.join(stage.rjust(19) for stage in stages)]
+    for result in report['results']:
+        lines.append(str(result['rows']).rjust(10) + ''.join(f"{result['seconds'][stage] * 1000:17.2f}ms" for stage in stages))
+    return '\n'.join(lines)
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+from analytics.loader import derived
+from analytics.metrics import COUNT_TOTALS, TEAM_METRICS, YDS_TOTALS, play_terms, team_metrics_from_totals
+from analytics.players import load_player_stats
+from analytics.roster import starting_qb
+
+RESAMPLES = 2000
+CONFIDENCE = 0.9
+# Fixed so a game's intervals (and anything rendered from them) don't change between runs
+SEED = 0
+# Draw-matrix cells held at once (8 MB of int64)
+BATCH_CELLS = 1_000_000
+
+# Counts and yardage sums aren't rates, so they get no interval
+RATE_METRICS = [metric for metric in TEAM_METRICS if metric not in ('plays', 'total_yds', 'pass_yds', 'rush_yds')]
+
+# The total each rate divides by; a resample where it is 0 leaves the rate undefined
+DENOMINATORS = {
+    'avg_yds': 'plays',
+    'offensive_efficacy': 'plays',
+    'pass_ratio': 'plays',
+    'rec_avg': 'completed',
+    'pass_efficiency': 'pass',
+    'rush_ratio': 'plays',
+    'car_avg': 'rush',
+    'rush_efficiency': 'rush',
+    'completion_pct': 'pass',
+    'yd_contribution': 'positive_yds',
+    'total_conversion_rate': 'plays',
+    'third_conversion_rate': 'third',
+}
+
+
+def _bounds(samples):
+    # NaN samples are skipped; a column with no defined sample gets NaN bounds
+    tail = (1 - CONFIDENCE) / 2 * 100
+    samples = np.atleast_2d(samples.T).T
+    bounds = np.full((2, samples.shape[1]), np.nan)
+    defined = ~np.isnan(samples).all(axis=0)
+    if defined.any():
+        bounds[:, defined] = np.nanpercentile(samples[:, defined], [tail, 100 - tail], axis=0)
+    return bounds
+
+
+def resample_counts(n, resamples=RESAMPLES, seed=SEED):
+    """Batches of a (resamples, n) matrix of how often each play is drawn in each bootstrap resample."""
+    rng = np.random.default_rng(seed)
+    # Rows per batch, so a long log never holds the full draw matrix at once
+    rows = max(1, BATCH_CELLS // n)
+    for start in range(0, resamples, rows):
+        batch = min(rows, resamples - start)
+        idx = rng.integers(0, n, size=(batch, n))
+        # Offset each row so one bincount tallies every resample in the batch at once
+        yield np.bincount((idx + np.arange(batch)[:, None] * n).ravel(), minlength=batch * n).reshape(batch, n)
+
+
+def team_intervals(plays, resamples=RESAMPLES, seed=SEED):
+    """Low/high bootstrap bounds of every team rate, resampling the game's plays."""
+    if not len(plays):
+        return pd.DataFrame(np.nan, index=RATE_METRICS, columns=['low', 'high'])
+    terms = play_terms(plays)[COUNT_TOTALS + YDS_TOTALS]
+    values = terms.to_numpy(dtype=float)
+    # Every resample's totals by matrix product, then the usual metric formulas column-wise
+    totals = pd.DataFrame(np.vstack([counts @ values for counts in resample_counts(len(plays), resamples, seed)]), columns=terms.columns)
+    samples = pd.DataFrame(team_metrics_from_totals(totals))[RATE_METRICS]
+    # team_metrics_from_totals reports an empty denominator as 0, which would drag the bounds toward 0
+    samples = samples.where(totals[[DENOMINATORS[metric] for metric in RATE_METRICS]].to_numpy() != 0)
+    low, high = _bounds(samples.to_numpy())
+    return pd.DataFrame({'low': low, 'high': high}, index=RATE_METRICS)
+
+
+def rate_interval(successes, attempts, resamples=RESAMPLES, seed=SEED):
+    """Bootstrap bounds of successes/attempts in percent.
+
+    Resampling `attempts` 0/1 outcomes with replacement is a Binomial(attempts, rate) draw, so
+    the whole index matrix collapses to one vectorized binomial sample. Returns None when there
+    were no attempts.
+    """
+    if not attempts:
+        return None
+    rng = np.random.default_rng(seed)
+    samples = rng.binomial(attempts, successes / attempts, size=resamples) / attempts * 100
+    low, high = _bounds(samples)[:, 0]
+    return (round(float(low), 2), round(float(high), 2))
+
+
+def player_intervals(stats, passer=None):
+    """{player: {gauge slot: (low, high)}} for the cmp% and eff_car% gauges on the player cards."""
+    passer = passer or starting_qb()
+    intervals = {}
+    for player, row in stats.items():
+        if player == passer:
+            cmp = rate_interval(row['cmp'], row['att'])
+        else:
+            cmp = rate_interval(row['rec'], row['targets'])
+        intervals[player] = {'cmp': cmp, 'eff': rate_interval(row['eff_car'], row['car'])}
+    return intervals
+
+
+def load_team_intervals(path):
+    """Team rate intervals for the play log at `path`, computed once per file version."""
+    return derived(path, 'team_intervals', team_intervals)
+
+
+def load_player_intervals(path):
+    """Player card intervals for the play log at `path`, computed once per file version."""
+    return derived(path, 'player_intervals', lambda plays: player_intervals(load_player_stats(path)))
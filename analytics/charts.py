@@ -0,0 +1,140 @@
+import collections
+import hashlib
+import io
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from matplotlib.figure import Figure
+
+from analytics.loader import sizeof
+from analytics.profiling import timed
+
+# Upper bound on cached renders (pngs are ~50KB, gauge dicts ~2KB), by count and by size
+CACHE_SIZE = 256
+CACHE_MB = float(os.environ.get('GTFA_RENDER_CACHE_MB', 64))
+
+# Same savefig options st.pyplot uses, so cached pngs look identical
+SAVEFIG_OPTIONS = {'format': 'png', 'bbox_inches': 'tight', 'dpi': 200}
+
+GAUGE_COLORS = {'green': '#0afa46', 'blue': '#2499ff', 'grey': '#d6d6d6'}
+
+
+class RenderCache:
+    """Thread-safe LRU of rendered charts keyed by data fingerprint."""
+
+    def __init__(self, maxsize=CACHE_SIZE, max_mb=CACHE_MB):
+        self.maxsize = maxsize
+        self.max_bytes = max_mb * 1e6
+        self.bytes = 0
+        self._items = collections.OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, render):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+        value = render()
+        with self._lock:
+            if key not in self._items:
+                self._sizes[key] = sizeof(value)
+                self.bytes += self._sizes[key]
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > 1 and (len(self._items) > self.maxsize or self.bytes > self.max_bytes):
+                old, _ = self._items.popitem(last=False)
+                self.bytes -= self._sizes.pop(old)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+render_cache = RenderCache()
+
+
+def fingerprint(*parts):
+    """Stable digest of chart inputs: frames/series by content, everything else by repr."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            digest.update(repr(list(part.columns) if isinstance(part, pd.DataFrame) else part.name).encode())
+            digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        elif isinstance(part, np.ndarray):
+            digest.update(repr((part.dtype, part.shape)).encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b'|')
+    return digest.hexdigest()
+
+
+@timed
+def pyplot_png(draw, *data, **params):
+    """PNG bytes of `draw(fig, ax, *data, **params)`, rendered once per distinct input.
+
+    Figures are built off pyplot so nothing is left in its global registry.
+    """
+    def render():
+        fig = Figure()
+        ax = fig.subplots()
+        draw(fig, ax, *data, **params)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **SAVEFIG_OPTIONS)
+        fig.clear()
+        return buffer.getvalue()
+
+    key = ('pyplot', draw.__qualname__, fingerprint(*data, sorted(params.items())))
+    return render_cache.get_or_render(key, render)
+
+
+def _semi_circular_gauge(percentage, color_input):
+    color = GAUGE_COLORS.get(color_input, '#e38c00')
+    # Grey gauges are placeholders for players without attempts
+    placeholder = color_input == 'grey'
+    value = 10 if placeholder else percentage
+
+    fig = go.Figure()
+    fig.add_trace(go.Indicator(
+        mode="gauge" if placeholder else "gauge+number",
+        value=value,
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "darkgray"},
+            'bar': {'color': color},  # Progress bar color
+            'bgcolor': "white",  # Background color
+            'steps': [
+                {'range': [0, 100], 'color': '#f2eded' if placeholder else '#e6e5e3'}  # Background color for gauge
+            ],
+            'threshold': {
+                'line': {'color': color, 'width': 4},
+                'thickness': 0.75,
+                'value': value
+            }
+        },
+    ))
+
+    # Update layout for a semi-circle effect
+    fig.update_layout(
+        margin=dict(t=5, b=5, l=5, r=5),
+        width=100,
+        height=75,
+        paper_bgcolor="rgba(0,0,0,0)",  # Transparent background
+    )
+    return fig.to_dict()
+
+
+@timed
+def create_semi_circular_gauge(percentage, title_input, color_input):
+    """Plotly figure dict for a player card gauge, built once per (percentage, color)."""
+    key = ('gauge', percentage, color_input)
+    return render_cache.get_or_render(key, lambda: _semi_circular_gauge(percentage, color_input))
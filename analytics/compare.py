@@ -0,0 +1,43 @@
+import pandas as pd
+
+from analytics.games import opponent
+from analytics.metrics import TEAM_METRICS, play_terms, team_metrics_from_totals
+
+# Play-mix shares describe style, not quality, so they aren't ranked
+UNRANKED = ['pass_ratio', 'rush_ratio']
+
+# Defense isn't tracked, so the quadrant plot sets ball movement against yards per play
+QUADRANT_AXES = ('avg_yds', 'offensive_efficacy')
+
+
+def compute_metric_matrix(plays):
+    """Games x team metrics from one grouped pass over the game-keyed season play table."""
+    terms = play_terms(plays)
+    totals = terms.groupby(plays['game'], observed=True, sort=False).sum()
+    matrix = pd.DataFrame(team_metrics_from_totals(totals), index=totals.index.astype(str))[TEAM_METRICS]
+    matrix['plays'] = matrix['plays'].astype(int)
+    return matrix.rename_axis('game')
+
+
+def rankings(matrix):
+    """1 = best game for each ranked metric; ties share the better rank."""
+    ranked = matrix.drop(columns=UNRANKED)
+    # Nullable ints, so a metric a log can't support (NaN) stays unranked
+    return ranked.rank(ascending=False, method='min').astype('Int64')
+
+
+def percentiles(matrix):
+    """Share of games each game is at or above, per metric."""
+    return matrix.drop(columns=UNRANKED).rank(pct=True, method='max')
+
+
+def quadrants(matrix, x=QUADRANT_AXES[0], y=QUADRANT_AXES[1]):
+    """Each game's side of the season median on both axes, e.g. 'high avg_yds / low offensive_efficacy'."""
+    above_x = matrix[x] >= matrix[x].median()
+    above_y = matrix[y] >= matrix[y].median()
+    side = lambda above, metric: above.map({True: f'high {metric}', False: f'low {metric}'})
+    return side(above_x, x) + ' / ' + side(above_y, y)
+
+
+def opponents(matrix):
+    return pd.Series([opponent(game) for game in matrix.index], index=matrix.index, name='opponent')
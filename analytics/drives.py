@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+from analytics.loader import derived
+from analytics.metrics import tracks_contribution
+
+DRIVE_COLUMNS = ['first_play', 'plays', 'start_pos', 'end_pos', 'yds', 'positive_yds', 'contributed_yds', 'outcome', 'points']
+
+# Inferred from how the last play of a drive ended
+POINTS = {'touchdown': 7, 'field_goal': 3, 'downs': 0, 'stop': 0}
+
+
+def drive_ids(plays):
+    """Drive number of every play, inferred in one pass over consecutive plays.
+
+    A new drive starts after a touchdown or a failed 4th down, when the `contributed`
+    flag flips, or on a 1st down that wasn't earned where the last play left the ball.
+    Tables with a `game` column (the season table) also break between games.
+    """
+    down = plays['down'].to_numpy(dtype=int)
+    field_pos = plays['field_pos'].to_numpy(dtype=float)
+    spot = field_pos + plays['yds'].fillna(0).to_numpy(dtype=float)
+    converted = plays['converted'].fillna(False).to_numpy(dtype=bool)
+    contributed = plays['contributed'].to_numpy(dtype=float, na_value=np.nan)
+
+    prev_down, prev_spot, prev_converted = down[:-1], spot[:-1], converted[:-1]
+    new_drive = (
+        (prev_spot >= 100)
+        | ((prev_down == 4) & ~prev_converted)
+        | (contributed[1:] != contributed[:-1]) & ~np.isnan(contributed[1:]) & ~np.isnan(contributed[:-1])
+        | ((down[1:] == 1) & ~prev_converted & (field_pos[1:] != prev_spot))
+    )
+    if 'game' in plays:
+        game = plays['game'].to_numpy()
+        new_drive |= game[1:] != game[:-1]
+    return np.concatenate([[0], np.cumsum(new_drive)]) if len(down) else np.zeros(0, dtype=int)
+
+
+def compute_drives(plays):
+    """Drive table for a play log: one row per inferred drive, in order."""
+    ids = drive_ids(plays)
+    if not len(ids):
+        return pd.DataFrame(columns=DRIVE_COLUMNS)
+    first = np.flatnonzero(np.diff(ids, prepend=-1))
+    last = np.append(first[1:], len(ids)) - 1
+
+    yds = plays['yds'].fillna(0).to_numpy(dtype=float)
+    field_pos = plays['field_pos'].to_numpy(dtype=float)
+    down = plays['down'].to_numpy(dtype=int)
+    converted = plays['converted'].fillna(False).to_numpy(dtype=bool)
+    contributed = plays['contributed'].fillna(False).to_numpy(dtype=bool)
+    end_pos = np.minimum(field_pos[last] + yds[last], 100)
+
+    outcome = np.select(
+        [end_pos >= 100, contributed[last], (down[last] == 4) & ~converted[last]],
+        ['touchdown', 'field_goal', 'downs'],
+        'stop',
+    )
+    return pd.DataFrame({
+        'first_play': first,
+        'plays': last - first + 1,
+        'start_pos': field_pos[first].astype(int),
+        'end_pos': end_pos.astype(int),
+        'yds': np.add.reduceat(yds, first),
+        'positive_yds': np.add.reduceat(np.clip(yds, 0, None), first),
+        'contributed_yds': np.add.reduceat(np.where(contributed, yds, 0.0), first) if tracks_contribution(plays).any() else np.nan,
+        'outcome': outcome,
+        'points': pd.Series(outcome).map(POINTS).to_numpy(dtype=int),
+    }, index=pd.RangeIndex(len(first), name='drive'))
+
+
+def drive_points(drives):
+    # Points of the drive each play belongs to, aligned with the plays
+    return np.repeat(drives['points'].to_numpy(dtype=float), drives['plays'].to_numpy(dtype=int))
+
+
+def load_drives(path):
+    """Drive table for the play log at `path`, computed once per file version."""
+    return derived(path, 'drives', compute_drives)
+
+
+def drive_summary(drives):
+    """Game totals read straight off the drive table."""
+    n_drives = len(drives)
+    positive = drives['positive_yds'].sum()
+    return {
+        'drives': n_drives,
+        'scoring_drives': int((drives['points'] > 0).sum()),
+        'points': int(drives['points'].sum()),
+        'plays_per_drive': float(drives['plays'].mean()) if n_drives else 0.0,
+        'yds_per_drive': float(drives['yds'].mean()) if n_drives else 0.0,
+        'avg_start_pos': float(drives['start_pos'].mean()) if n_drives else 0.0,
+        'yd_contribution': float(drives['contributed_yds'].sum(min_count=1) / positive) if positive else 0.0,
+    }
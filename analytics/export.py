@@ -0,0 +1,109 @@
+import concurrent.futures
+import html
+import os
+
+import pandas as pd
+
+from analytics.bootstrap import load_team_intervals
+from analytics.charts import pyplot_png
+from analytics.drives import drive_summary, load_drives
+from analytics.figures import draw_avg_yds, draw_team_graph, draw_yds, yds_charts
+from analytics.games import SITUATION_NOTES
+from analytics.loader import load_plays
+from analytics.metrics import load_team_metrics
+from analytics.players import load_player_stats
+from analytics.roster import starting_qb
+from analytics.season import game_id
+from analytics.series import load_team_series
+from analytics.situations import TERRITORIES, load_situations, situation_captions, situation_table
+
+EXPORT_DIR = './exports'
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; margin-bottom: 1em; }}
+td, th {{ border: 1px solid #ccc; padding: 2px 8px; text-align: right; }}
+img {{ width: 32%; }}
+.success {{ color: #0a7a2f; }} .warning {{ color: #a86b00; }} .error {{ color: #b00020; }} .info {{ color: #1d5fa8; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def _png(out_dir, name, png):
+    with open(os.path.join(out_dir, name), 'wb') as f:
+        f.write(png)
+    return f'<img src="{html.escape(name)}" alt="{html.escape(name)}">'
+
+
+def _captions(captions):
+    return ''.join(f'<p class="{level}">{html.escape(text)}</p>' for level, text in captions)
+
+
+def export_game(path, export_dir=EXPORT_DIR):
+    """Write ./<export_dir>/<game id>/index.html plus its chart pngs; returns the html path."""
+    game = game_id(path)
+    out_dir = os.path.join(export_dir, game)
+    # Load first so a bad log leaves no empty export directory behind
+    plays = load_plays(path)
+    os.makedirs(out_dir, exist_ok=True)
+    passer = starting_qb()
+
+    parts = [f'<h1>{html.escape(game)}</h1>', '<h2>team metrics</h2>']
+    metrics = load_team_metrics(path)
+    table = pd.Series({metric: round(value, 2) for metric, value in metrics.items()}, name='value', dtype=object).to_frame()
+    parts.append(table.join(load_team_intervals(path).round(2)).to_html(na_rep='N/A'))
+    parts.append(_png(out_dir, 'team_graph.png', pyplot_png(draw_team_graph, load_team_series(path))))
+
+    parts.append('<h2>drives</h2>')
+    drives = load_drives(path)
+    parts.append(pd.Series(drive_summary(drives), name='value', dtype=object).round(2).to_frame().to_html(na_rep='N/A'))
+    parts.append(drives.to_html())
+
+    parts.append('<h2>offensive review</h2>')
+    situations = load_situations(path)
+    coach_notes = SITUATION_NOTES.get(game, {})
+    for terr, (_, _, label) in TERRITORIES.items():
+        for down in (1, 3):
+            parts.append(f'<h3>{html.escape(label)}, down {down}</h3>')
+            parts.append(situation_table(situations, terr, down).to_html())
+            parts.append(_captions(situation_captions(situations, terr, down)))
+            if (terr, down) in coach_notes:
+                parts.append(_captions([('info', coach_notes[(terr, down)])]))
+
+    parts.append('<h2>player eval</h2>')
+    parts.append(pd.DataFrame.from_dict(load_player_stats(path), orient='index').to_html())
+    for player, player_yds, passing_yds in yds_charts(plays, passer):
+        parts.append(f'<h3>{html.escape(player)}</h3>')
+        parts.append(_png(out_dir, f'yds_{player}.png', pyplot_png(draw_yds, player_yds, passing_yds, len(plays), player)))
+        parts.append(_png(out_dir, f'avg_yds_{player}.png', pyplot_png(draw_avg_yds, player_yds, passing_yds, len(plays), player)))
+
+    index = os.path.join(out_dir, 'index.html')
+    with open(index, 'w') as f:
+        f.write(PAGE.format(title=html.escape(game), body='\n'.join(parts)))
+    return index
+
+
+def export_games(paths, export_dir=EXPORT_DIR, workers=None):
+    """Export every log in parallel, one game per worker process.
+
+    Returns (written html paths, {csv path: error}); a game that fails is skipped without stopping the rest.
+    """
+    written, rejected = [], {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(export_game, path, export_dir): path for path in paths}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                written.append(future.result())
+            except Exception as e:
+                rejected[futures[future]] = e
+    return written, rejected
@@ -0,0 +1,178 @@
+from analytics.trends import POINT_BUDGET, downsample
+
+
+def yds_charts(plays, passer):
+    """(player, yds, passing yds or None) for everyone with at least 3 plays, in log order."""
+    charts = []
+    for player in plays['player'].unique().tolist():
+        player_yds = plays.loc[plays['player'] == player, 'yds']
+        if len(player_yds) < 3:
+            continue
+        passing_yds = plays.loc[plays['action'] == 'rec', 'yds'] if player == passer else None
+        charts.append((player, player_yds, passing_yds))
+    return charts
+
+
+def card_gauges(stats, is_passer):
+    """(slot, label, percentage, title, color) of each gauge on a player card; grey gauges stand in for N/A."""
+    gauges = []
+    if is_passer:
+        if stats['att'] > 0:
+            gauges.append(('cmp', 'cmp%', round((stats['cmp']/stats['att'])*100,2), 'cmp', 'orange'))
+    elif stats['targets'] > 0:
+        gauges.append(('cmp', 'cmp%', round((stats['rec']/stats['targets'])*100,2), 'rec_eff', 'green'))
+    else:
+        gauges.append(('cmp', 'N/A', 0, 'rec_eff', 'grey'))
+    if stats['car'] > 0:
+        gauges.append(('eff', 'eff_car%', round((stats['eff_car']/stats['car'])*100,2), 'car_eff', 'blue'))
+    else:
+        gauges.append(('eff', 'N/A', 0, 'car_eff', 'grey'))
+    return gauges
+
+
+def draw_quadrant(fig, ax, points, labels):
+    # Games split at the season medians of both axes (the two columns of `points`)
+    x, y = points.columns
+    ax.scatter(points[x], points[y], color='#b3a369')
+    for game, label in labels.items():
+        ax.annotate(label, (points.loc[game, x], points.loc[game, y]), xytext=(4, 4), textcoords='offset points', fontsize=10)
+    ax.axvline(points[x].median(), color='gray', linewidth=1)
+    ax.axhline(points[y].median(), color='gray', linewidth=1)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    ax.set_title('Ball movement by game')
+
+
+def draw_team_graph(fig, ax, df_team_graph):
+    if df_team_graph.empty:
+        # A live log before its first play
+        ax.set_xlabel('Play')
+        ax.set_title('Efficiency / time')
+        return
+    # Plot yards vs. index for the current player (using index as x-axis)
+    ax.plot(df_team_graph.index, df_team_graph['efficiency'], marker='o', label='efficient movement %', color='#00d443')
+    # The series is NaN wherever contribution is undefined, so only draw it if some point is defined
+    has_contribution = df_team_graph['contributing_yds%'].notna().any()
+    if has_contribution:
+        ax.plot(df_team_graph.index, df_team_graph['contributing_yds%'], marker='o', label='yd contribution %', color='#f736ee')
+    
+    line = [0.5]*df_team_graph.shape[0]
+    ax.plot(df_team_graph.index, line)
+    ax.annotate(
+        '0.5',  # Text to display
+        xy=(0, 0.5),         # Point to annotate
+        xytext=(-0.5, 0.51),  # Text position
+        fontsize=12,                       # Font size
+        color='black'                       # Text color
+    )
+    
+    if has_contribution:
+        # Annotate the last point of the main plot (avg column)
+        last_index = df_team_graph.index[-1]
+        last_avg = df_team_graph['contributing_yds%'].iloc[-1]
+        ax.annotate(
+            f'({last_avg:.2f})',  # Text to display
+            xy=(last_index, last_avg),         # Point to annotate
+            xytext=(last_index-3, last_avg+0.03),  # Text position
+            fontsize=12,                       # Font size
+            color='black'                       # Text color
+        )
+    
+    # Annotate the last point of the main plot (avg column)
+    last_index = df_team_graph.index[-1]
+    last_avg = df_team_graph['efficiency'].iloc[-1]
+    ax.annotate(
+        f'({last_avg:.2f})',  # Text to display
+        xy=(last_index, last_avg),         # Point to annotate
+        xytext=(last_index-3, last_avg+0.02),  # Text position
+        fontsize=12,                       # Font size
+        color='black'                       # Text color
+    )
+    
+    # limit the y axis manually
+    ax.set_ylim(last_avg-0.16,1.03)
+    
+    # Label the axes and title
+    ax.set_xlabel('Play')
+    ax.set_title('Efficiency / time')
+    # Add a legend
+    ax.legend()
+
+
+def draw_yds(fig, ax, player_yds, passing_yds, n_plays, player):
+    # Plot yards vs. index for the current player (using index as x-axis)
+    ax.plot(player_yds.index, player_yds, marker='o', label=player)
+    line = [5]*n_plays
+    ax.plot(range(n_plays), line)
+    if passing_yds is not None:
+        ax.plot(passing_yds.index, passing_yds, marker='o', label=player+' passing')
+    ax.annotate(
+        '5',  # Text to display
+        xy=(0, 5),         # Point to annotate
+        xytext=(-0.5, 5),  # Text position
+        fontsize=12,                       # Font size
+        color='black'                       # Text color
+    )    
+    # Label the axes and title
+    ax.set_xlabel('Play')
+    ax.set_ylabel('Yards (yds)')
+    ax.set_title('yds / time')
+    # Add a legend
+    ax.legend()
+
+
+def draw_avg_yds(fig, ax, player_yds, passing_yds, n_plays, player):
+    # Plot yards vs. index for the current player (using index as x-axis)
+    player_avg = player_yds.expanding().mean()
+    ax.plot(player_avg.index, player_avg, marker='o', label=player)
+    line = [5]*n_plays
+    ax.plot(range(n_plays), line)
+    ax.annotate(
+        '5',  # Text to display
+        xy=(0, 5),         # Point to annotate
+        xytext=(-0.5, 5),  # Text position
+        fontsize=12,                       # Font size
+        color='black'                       # Text color
+    )
+    if passing_yds is not None:
+        passing_avg = passing_yds.expanding().mean()
+        ax.plot(passing_avg.index, passing_avg, marker='o', label=player+' passing')
+        last_index = passing_avg.index[-1]
+        last_avg = passing_avg.iloc[-1]
+        ax.annotate(
+            f'({last_avg:.2f})',  # Text to display
+            xy=(last_index, last_avg),         # Point to annotate
+            xytext=(last_index-1.5, last_avg+1.5),  # Text position
+            fontsize=12,                       # Font size
+            color='black'                       # Text color
+        )
+    
+    # Annotate the last point of the main plot (avg column)
+    last_index = player_avg.index[-1]
+    last_avg = player_avg.iloc[-1]
+    ax.annotate(
+        f'({last_avg:.2f})',  # Text to display
+        xy=(last_index, last_avg),         # Point to annotate
+        xytext=(last_index-1.5, last_avg+1.5),  # Text position
+        fontsize=12,                       # Font size
+        color='black'                       # Text color
+    )
+    
+    # Label the axes and title
+    ax.set_xlabel('Play')
+    ax.set_ylabel('Yards (yds)')
+    ax.set_title('avg yds / time')
+    # Add a legend
+    ax.legend()
+
+
+def draw_player_trend(fig, ax, trend, player):
+    # Long histories are thinned to a fixed point budget before plotting
+    for col, label in (('expanding', 'avg yds'), ('rolling', 'rolling avg yds')):
+        x, y = downsample(trend['seq'], trend[col])
+        ax.plot(x, y, marker='o' if len(trend) <= POINT_BUDGET else None, label=label)
+    ax.axhline(5, color='gray', linewidth=1)
+    ax.set_xlabel('Play (season)')
+    ax.set_ylabel('Yards (yds)')
+    ax.set_title(player+' avg yds / time')
+    ax.legend()
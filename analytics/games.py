@@ -0,0 +1,53 @@
+import os
+
+DATA_DIR = './data'
+
+# 2024 schedule in order, by game id (the play log name minus -PLAYS). Each page under
+# pages/ calls render_game with one of these, and shows the full report as soon as
+# ./data/<game id>-PLAYS exists.
+GAMES = (
+    'FSU-GT-08-24-24',
+    'GAST-GT-08-31-24',
+    'SYR-GT-09-07-24',
+    'VMI-GT-09-14-24',
+    'LOU-GT-09-21-24',
+    'DUKE-GT-10-05-24',
+    'UNC-GT-10-12-24',
+    'ND-GT-10-19-24',
+    'VT-GT-10-26-24',
+    'MIA-GT-11-09-24',
+    'NCST-GT-11-21-24',
+    'UGA-GT-11-29-24',
+    'VAN-GT-12-27-24',
+)
+
+# Hand-written review notes per game
+PLAYER_NOTES = {
+    'FSU-GT-08-24-24': {
+        'haynes': ['green', 'consistent! efficient movements of the ball agnostic of game clock.'],
+        'singleton': ['yellow', 'low production but dependable target. \n  '],
+        'rutherford': ['yellow', 'potentially detrimental incompletions. productive in clutch time.'],
+        'king': ['yellow', 'decent balance for our offense. Rushing needs to improve.'],
+        'alexander': ['green', 'RB2!']
+    },
+}
+
+# Shown under the generated captions of the offensive review, keyed by (territory, down)
+SITUATION_NOTES = {
+    'FSU-GT-08-24-24': {
+        ('gt_terr', 1): 'Approaching 40% conversions with our Pass/Rush Ratio and efficacy is elite.',
+        ('red_zone', 3): '3rd and goal.... hand it off to Jamal.',
+    },
+}
+
+
+def play_log(game, data_dir=DATA_DIR):
+    return os.path.join(data_dir, game + '-PLAYS')
+
+
+def has_play_log(game, data_dir=DATA_DIR):
+    return os.path.exists(play_log(game, data_dir))
+
+
+def opponent(game):
+    return game.split('-GT-')[0]
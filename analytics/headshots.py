@@ -0,0 +1,75 @@
+import base64
+import functools
+import io
+import os
+
+from PIL import Image
+
+from analytics.profiling import timed
+from analytics.roster import headshot_path
+
+# Streamlit serves ./static at app/static/ when enableStaticServing is on
+STATIC_DIR = './static'
+THUMBS_SUBDIR = 'headshots'
+# Player cards draw headshots 200px wide
+THUMB_WIDTH = 200
+
+
+def thumbnail_path(player):
+    return os.path.join(STATIC_DIR, THUMBS_SUBDIR, player + '.jpg')
+
+
+def _resize(path, width):
+    with Image.open(path) as image:
+        image = image.convert('RGB')
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=85, optimize=True)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=64)
+def _thumbnail(path, mtime, width):
+    # mtime is part of the key so a replaced headshot is picked up without a restart
+    return _resize(path, width)
+
+
+@functools.lru_cache(maxsize=64)
+def _encoded(path, mtime, width):
+    return base64.b64encode(_thumbnail(path, mtime, width)).decode()
+
+
+def thumbnail_bytes(player, width=THUMB_WIDTH):
+    path = headshot_path(player)
+    return _thumbnail(path, os.path.getmtime(path), width)
+
+
+@timed
+def get_image_as_base64(player, width=THUMB_WIDTH):
+    path = headshot_path(player)
+    return _encoded(path, os.path.getmtime(path), width)
+
+
+def publish_thumbnail(player, width=THUMB_WIDTH):
+    """Write the player's thumbnail under ./static and return its url, or None if it can't be written."""
+    source = headshot_path(player)
+    target = thumbnail_path(player)
+    try:
+        if not os.path.exists(target) or os.path.getmtime(target) < os.path.getmtime(source):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target + '.tmp', 'wb') as file:
+                file.write(thumbnail_bytes(player, width))
+            os.replace(target + '.tmp', target)
+    except OSError:
+        return None
+    return f'app/static/{THUMBS_SUBDIR}/{player}.jpg'
+
+
+@timed
+def headshot_html(player, width=THUMB_WIDTH, static=False):
+    """Centered headshot <img> for a player card, either a static url or an inlined thumbnail."""
+    src = publish_thumbnail(player, width) if static else None
+    if src is None:
+        src = f'data:image/jpeg;base64,{get_image_as_base64(player, width)}'
+    return f"""<div style="text-align:center;"><img src="{src}" alt="{player}" width="{width}" style="border-radius:10px;"></div>"""
@@ -0,0 +1,178 @@
+import os
+import threading
+
+import pandas as pd
+
+from analytics.loader import memoize, parse_csv
+from analytics.metrics import is_efficient, team_metrics_from_totals
+from analytics.players import PLAYER_STATS
+from analytics.roster import ACTIONS, starting_qb
+from analytics.schema import PLAY_COLUMNS
+from analytics.validate import PlayLogError, check_chunk
+
+
+def _flag(value):
+    if value is None or value == '' or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, str):
+        return value.strip().lower() == 'true'
+    return bool(value)
+
+
+def normalize_play(play):
+    """Coerce an entered play to the log schema; raises ValueError on anything unusable."""
+    action = str(play['action']).strip().lower()
+    if action not in ACTIONS:
+        raise ValueError(f"action must be one of {ACTIONS}, got {play['action']!r}")
+    return {
+        'down': int(play['down']),
+        'ytg': float(play['ytg']),
+        'field_pos': int(play['field_pos']),
+        'player': str(play['player']).strip().lower(),
+        'action': action,
+        # Rushes leave completed blank
+        'completed': _flag(play.get('completed')) if action == 'rec' else None,
+        'yds': float(play['yds']),
+        'converted': bool(_flag(play.get('converted'))),
+        'contributed': _flag(play.get('contributed')),
+    }
+
+
+def _csv_value(value):
+    return '' if value is None else str(value)
+
+
+class LiveGame:
+    """Running team metrics, player stats and efficiency series for a game logged play by play.
+
+    Each play is appended to the csv (fsync'd, never rewritten) and folded into
+    the accumulators, so refreshing the sideline view costs the same on play 5 or play 80.
+    """
+
+    def __init__(self, path, passer=None):
+        self.path = path
+        self.passer = passer or starting_qb()
+        self._lock = threading.Lock()
+        self.totals = dict.fromkeys(
+            ['plays', 'pass', 'rush', 'completed', 'third', 'efficient', 'efficient_pass',
+             'efficient_rush', 'converted', 'third_converted', 'tracked'], 0)
+        self.totals.update(dict.fromkeys(
+            ['yds', 'pass_yds', 'rush_yds', 'completed_yds', 'contributed_yds', 'positive_yds'], 0.0))
+        self.players = {self.passer: dict.fromkeys(PLAYER_STATS, 0)}
+        self._receivers = []
+        self.efficiency = []
+        self.contributing_pct = []
+        self.columns = PLAY_COLUMNS
+        self._recover()
+
+    def _recover(self):
+        if not os.path.exists(self.path):
+            with open(self.path, 'w') as file:
+                file.write(','.join(self.columns) + '\n')
+            return
+        # A crash mid-append leaves a line without its newline; drop it
+        with open(self.path, 'rb+') as file:
+            data = file.read()
+            if data and not data.endswith(b'\n'):
+                file.truncate(data.rfind(b'\n') + 1)
+        self.columns = list(pd.read_csv(self.path, nrows=0).columns)
+        plays = parse_csv(self.path)
+        for play in plays.astype(object).where(plays.notna(), None).to_dict('records'):
+            self._accumulate(play)
+
+    def _accumulate(self, play):
+        totals = self.totals
+        yds = play['yds']
+        is_pass = play['action'] == 'rec'
+        is_rush = play['action'] == 'rush'
+        completed = is_pass and bool(play['completed'])
+        converted = bool(play['converted'])
+        efficient = bool(is_efficient(yds, converted))
+
+        totals['plays'] += 1
+        totals['pass'] += is_pass
+        totals['rush'] += is_rush
+        totals['completed'] += completed
+        totals['third'] += play['down'] == 3
+        totals['yds'] += yds
+        totals['pass_yds'] += yds if is_pass else 0.0
+        totals['rush_yds'] += yds if is_rush else 0.0
+        totals['completed_yds'] += yds if completed else 0.0
+        totals['efficient'] += efficient
+        totals['efficient_pass'] += efficient and is_pass
+        totals['efficient_rush'] += efficient and is_rush
+        totals['converted'] += converted
+        totals['third_converted'] += converted and play['down'] == 3
+        # Same per-play rule as metrics.tracks_contribution
+        totals['tracked'] += play['contributed'] is not None
+        totals['contributed_yds'] += yds if play['contributed'] else 0.0
+        totals['positive_yds'] += max(yds, 0.0)
+
+        stats = self.players.setdefault(play['player'], dict.fromkeys(PLAYER_STATS, 0))
+        if is_pass:
+            if play['player'] not in self._receivers:
+                self._receivers.append(play['player'])
+            stats['targets'] += 1
+            stats['rec'] += completed
+            stats['rec_yds'] += yds if completed else 0
+            passer = self.players[self.passer]
+            passer['att'] += 1
+            passer['cmp'] += completed
+            passer['pass_yds'] += yds
+            passer['plays'] += 1
+            stats['plays'] += 1
+        elif is_rush:
+            stats['car'] += 1
+            stats['eff_car'] += efficient
+            stats['rush_yds'] += yds
+            stats['plays'] += 1
+
+        self.efficiency.append(totals['efficient'] / totals['plays'])
+        self.contributing_pct.append(totals['contributed_yds'] / totals['positive_yds'] if totals['positive_yds'] > 0 and totals['tracked'] else float('nan'))
+
+    def append(self, play):
+        """Write-ahead append one play to the log, then fold it into the running stats.
+
+        The play is checked with the same rules the loader applies, so a bad entry raises
+        PlayLogError (a ValueError) here instead of making the whole log unreadable.
+        """
+        play = normalize_play(play)
+        if 'contributed' not in self.columns:
+            # Older logs have no contributed column, so the flag isn't recorded or counted
+            play['contributed'] = None
+        values = [_csv_value(play[col]) for col in self.columns]
+        _, problems = check_chunk(pd.DataFrame([values], columns=self.columns, dtype=str))
+        with self._lock:
+            if problems:
+                # +2: the header is line 1 and the new play goes after every recorded one
+                raise PlayLogError(self.path, [(self.totals['plays'] + 2, message) for _, message in problems])
+            line = ','.join(values) + '\n'
+            with open(self.path, 'a') as file:
+                file.write(line)
+                file.flush()
+                os.fsync(file.fileno())
+            self._accumulate(play)
+        return play
+
+    def team_metrics(self):
+        with self._lock:
+            return team_metrics_from_totals(self.totals)
+
+    def player_stats(self):
+        with self._lock:
+            # Same ordering as compute_player_stats: passer, receivers, everyone else, then by plays
+            order = [self.passer] + self._receivers + list(self.players)
+            results = {player: dict(self.players[player]) for player in dict.fromkeys(order)}
+        return dict(sorted(results.items(), key=lambda item: item[1]['plays'], reverse=True))
+
+    def team_series(self):
+        with self._lock:
+            return pd.DataFrame({'efficiency': self.efficiency, 'contributing_yds%': self.contributing_pct})
+
+
+def live_game(path):
+    """Shared LiveGame for `path`, recovered from the existing log on first use."""
+    # One accumulator per log in the shared store, so it counts against the memory ceiling.
+    # Its log is only ever appended to, so an evicted one is simply recovered again.
+    path = os.path.abspath(path)
+    return memoize(('live', path), None, lambda: LiveGame(path))
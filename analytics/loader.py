@@ -0,0 +1,139 @@
+import collections
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from analytics import store
+from analytics.roster import encode_plays
+from analytics.validate import read_play_log
+
+# Ceiling on everything cached process-wide: play logs, what's derived from them and the season views (GTFA_MEMORY_MB)
+MEMORY_LIMIT_MB = float(os.environ.get('GTFA_MEMORY_MB', 512))
+
+# Process-wide store shared by every session, least recently used entry first:
+# key -> {'version', 'value', 'derived': {name: value}, 'bytes'}. A play log is keyed by
+# its abspath (version = mtime, value = plays); memoize() adds entries under tuple keys.
+_entries = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_csv(path):
+    """Validated, normalized plays from a csv log; raises analytics.validate.PlayLogError on bad rows."""
+    return read_play_log(path)
+
+
+def _parse(path):
+    # Prefer the columnar copy; rebuild it from the csv whenever the csv is newer
+    if store.is_fresh(path):
+        # Cheap recode in case the roster grew since the store was written
+        return encode_plays(store.read_store(path))
+    plays = parse_csv(path)
+    try:
+        store.write_store(plays, path)
+    except OSError:
+        pass
+    return plays
+
+
+def _freeze(plays):
+    # Mark the backing buffers read-only so a page can't mutate the shared copy in place
+    for col in plays.columns:
+        values = plays[col].array
+        for attr in ('_ndarray', '_data', '_mask', '_codes'):
+            buffer = getattr(values, attr, None)
+            if isinstance(buffer, np.ndarray):
+                buffer.flags.writeable = False
+    return plays
+
+
+def sizeof(value):
+    """Rough in-memory size of a cached value in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sizeof(item) for item in value)
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + sizeof(vars(value))
+    return sys.getsizeof(value)
+
+
+def _evict():
+    # Caller holds _cache_lock; the most recently used entry always stays
+    total = sum(entry['bytes'] for entry in _entries.values())
+    while total > MEMORY_LIMIT_MB * 1e6 and len(_entries) > 1:
+        _, entry = _entries.popitem(last=False)
+        total -= entry['bytes']
+
+
+def _entry(key, version, build):
+    with _cache_lock:
+        entry = _entries.get(key)
+        if entry is not None and entry['version'] == version:
+            _entries.move_to_end(key)
+            return entry
+    # Built outside the lock so one slow build doesn't hold up every other entry
+    value = build()
+    with _cache_lock:
+        entry = _entries.get(key)
+        if entry is None or entry['version'] != version:
+            entry = {'version': version, 'value': value, 'derived': {}, 'bytes': sizeof(value)}
+            _entries[key] = entry
+        _entries.move_to_end(key)
+        _evict()
+    return entry
+
+
+def _game(path):
+    path = os.path.abspath(path)
+    return _entry(path, os.path.getmtime(path), lambda: _freeze(_parse(path)))
+
+
+def memoize(key, version, build):
+    """Keep `build()` in the shared store under `key` until `version` changes, counted against the same ceiling."""
+    return _entry(key, version, build)['value']
+
+
+def load_plays(path):
+    """Return a read-only view of the play log at `path`, parsed once per file version."""
+    # Shallow copy: new columns stay local to the caller, the data itself is shared
+    return _game(path)['value'].copy(deep=False)
+
+
+def derived(path, name, build):
+    """Memoize `build(plays)` for the play log at `path`, recomputed only when the file changes."""
+    entry = _game(path)
+    with _cache_lock:
+        if name in entry['derived']:
+            return entry['derived'][name]
+    value = build(entry['value'].copy(deep=False))
+    with _cache_lock:
+        if name not in entry['derived']:
+            entry['derived'][name] = value
+            entry['bytes'] += sizeof(value)
+            _evict()
+        return entry['derived'][name]
+
+
+def cache_stats():
+    """Play logs and other entries held in the shared store, and their footprint against the ceiling."""
+    with _cache_lock:
+        return {
+            'games': sum(isinstance(key, str) for key in _entries),
+            'entries': len(_entries),
+            'mb': sum(entry['bytes'] for entry in _entries.values()) / 1e6,
+            'limit_mb': MEMORY_LIMIT_MB,
+        }
+
+
+def clear_cache():
+    with _cache_lock:
+        _entries.clear()
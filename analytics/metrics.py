@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+from analytics.loader import derived
+
+# Display order of the team metric cards
+TEAM_METRICS = [
+    'plays', 'total_yds', 'avg_yds', 'offensive_efficacy',
+    'pass_ratio', 'pass_yds', 'rec_avg', 'pass_efficiency',
+    'rush_ratio', 'rush_yds', 'car_avg', 'rush_efficiency',
+    'completion_pct', 'yd_contribution', 'total_conversion_rate', 'third_conversion_rate',
+]
+
+# An efficient movement advances the ball more than this many yards or converts
+EFFICIENT_YDS = 5.0
+
+
+def bool_flags(plays, col):
+    # Nullable booleans -> plain bool array, unknown counts as False
+    return plays[col].fillna(False).to_numpy(dtype=bool)
+
+
+def _ratio(num, den):
+    # Columns of a grouped totals frame divide element-wise, empty groups give 0
+    if np.ndim(den):
+        return np.divide(np.asarray(num, dtype=float), np.asarray(den, dtype=float), out=np.zeros(len(den)), where=np.asarray(den) != 0)
+    return float(num) / float(den) if den else 0.0
+
+
+def is_efficient(yds, converted):
+    # The one success rule every view uses; works on scalars and arrays alike
+    return (yds > EFFICIENT_YDS) | converted
+
+
+def tracks_contribution(plays):
+    """Per-play flag: the log records contributed for this play (older logs, e.g. GAST, never do)."""
+    return plays['contributed'].notna().to_numpy()
+
+
+def efficient_mask(plays):
+    return is_efficient(plays['yds'].to_numpy(dtype=float), bool_flags(plays, 'converted'))
+
+
+# Totals that are counts of plays vs sums of yards
+COUNT_TOTALS = ['plays', 'pass', 'rush', 'completed', 'third', 'efficient', 'efficient_pass', 'efficient_rush', 'converted', 'third_converted', 'tracked']
+YDS_TOTALS = ['yds', 'pass_yds', 'rush_yds', 'completed_yds', 'contributed_yds', 'positive_yds']
+
+
+def play_terms(plays):
+    """What each play adds to every team total; summing any set of rows gives that set's totals."""
+    yds = plays['yds'].to_numpy(dtype=float)
+    action = plays['action'].to_numpy(dtype=object)
+    is_pass = action == 'rec'
+    is_rush = action == 'rush'
+    completed = is_pass & bool_flags(plays, 'completed')
+    converted = bool_flags(plays, 'converted')
+    efficient = is_efficient(yds, converted)
+    third = plays['down'].to_numpy() == 3
+    contributed = bool_flags(plays, 'contributed')
+
+    return pd.DataFrame({
+        'plays': np.ones(len(yds), dtype=int),
+        'pass': is_pass,
+        'rush': is_rush,
+        'completed': completed,
+        'third': third,
+        'efficient': efficient,
+        'efficient_pass': efficient & is_pass,
+        'efficient_rush': efficient & is_rush,
+        'converted': converted,
+        'third_converted': converted & third,
+        'tracked': tracks_contribution(plays),
+        'yds': yds,
+        'pass_yds': np.where(is_pass, yds, 0.0),
+        'rush_yds': np.where(is_rush, yds, 0.0),
+        'completed_yds': np.where(completed, yds, 0.0),
+        'contributed_yds': np.where(contributed, yds, 0.0),
+        'positive_yds': np.clip(yds, 0, None),
+    }, index=plays.index)
+
+
+def compute_team_totals(plays):
+    """Additive counts and yardage sums the team metrics are derived from."""
+    sums = play_terms(plays).sum()
+    return {**{key: int(sums[key]) for key in COUNT_TOTALS}, **{key: float(sums[key]) for key in YDS_TOTALS}}
+
+
+def team_metrics_from_totals(totals):
+    """Team metrics from one game's totals dict, or a column per metric from a frame of totals (one row per group)."""
+    n_plays = totals['plays']
+    pass_ratio = _ratio(totals['pass'], n_plays)
+    # N/A rather than 0 when no play records contributed (see tracks_contribution)
+    yd_contribution = _ratio(totals['contributed_yds'], totals['positive_yds'])
+    yd_contribution = np.where(totals['tracked'] > 0, yd_contribution, np.nan) if np.ndim(n_plays) else (yd_contribution if totals['tracked'] else float('nan'))
+
+    return {
+        'plays': n_plays,
+        'total_yds': totals['pass_yds'] + totals['rush_yds'],
+        'avg_yds': _ratio(totals['yds'], n_plays),
+        'offensive_efficacy': _ratio(totals['efficient'], n_plays),
+        'pass_ratio': pass_ratio,
+        'pass_yds': totals['pass_yds'],
+        'rec_avg': _ratio(totals['completed_yds'], totals['completed']),
+        'pass_efficiency': _ratio(totals['efficient_pass'], totals['pass']),
+        'rush_ratio': np.where(n_plays > 0, 1 - pass_ratio, 0.0) if np.ndim(n_plays) else (1 - pass_ratio if n_plays else 0.0),
+        'rush_yds': totals['rush_yds'],
+        'car_avg': _ratio(totals['rush_yds'], totals['rush']),
+        'rush_efficiency': _ratio(totals['efficient_rush'], totals['rush']),
+        'completion_pct': _ratio(totals['completed'], totals['pass']),
+        'yd_contribution': yd_contribution,
+        'total_conversion_rate': _ratio(totals['converted'], n_plays),
+        'third_conversion_rate': _ratio(totals['third_converted'], totals['third']),
+    }
+
+
+def compute_team_metrics(plays):
+    """Compute every team dashboard metric from boolean masks over a single play log."""
+    return team_metrics_from_totals(compute_team_totals(plays))
+
+
+def load_team_metrics(path):
+    """Team metrics for the play log at `path`, computed once per file version."""
+    return dict(derived(path, 'team_metrics', compute_team_metrics))
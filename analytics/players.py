@@ -0,0 +1,55 @@
+import pandas as pd
+
+from analytics.loader import derived
+from analytics.metrics import bool_flags, efficient_mask
+from analytics.roster import starting_qb
+
+PLAYER_STATS = ['plays', 'att', 'cmp', 'pass_yds', 'targets', 'rec', 'rec_yds', 'car', 'eff_car', 'rush_yds']
+
+
+def compute_player_stats(plays, passer=None):
+    """Per-player card stats from a single groupby over (player, action), ordered by plays."""
+    passer = passer or starting_qb()
+    is_pass = (plays['action'] == 'rec').to_numpy()
+    completed = is_pass & bool_flags(plays, 'completed')
+    frame = pd.DataFrame({
+        'player': plays['player'],
+        'action': plays['action'],
+        'n': 1,
+        'yds': plays['yds'].fillna(0).to_numpy(dtype=float),
+        'cmp': completed,
+        'cmp_yds': plays['yds'].fillna(0).to_numpy(dtype=float) * completed,
+        'eff': efficient_mask(plays),
+    })
+    grouped = frame.groupby(['player', 'action'], sort=False, observed=True).sum()
+
+    # Passers first, then receivers, then rush-only players, each in order of appearance
+    order = [passer] + frame.loc[is_pass, 'player'].unique().tolist() + frame['player'].unique().tolist()
+    results = {player: dict.fromkeys(PLAYER_STATS, 0) for player in dict.fromkeys(order)}
+
+    for (player, action), row in grouped.iterrows():
+        stats = results[player]
+        if action == 'rec':
+            stats['targets'] = int(row['n'])
+            stats['rec'] = int(row['cmp'])
+            stats['rec_yds'] = float(row['cmp_yds'])
+        elif action == 'rush':
+            stats['car'] = int(row['n'])
+            stats['eff_car'] = int(row['eff'])
+            stats['rush_yds'] = float(row['yds'])
+
+    if 'rec' in grouped.index.get_level_values('action'):
+        passing = grouped.xs('rec', level='action').sum()
+        results[passer]['att'] = int(passing['n'])
+        results[passer]['cmp'] = int(passing['cmp'])
+        results[passer]['pass_yds'] = float(passing['yds'])
+
+    for stats in results.values():
+        stats['plays'] = stats['att'] + stats['targets'] + stats['car']
+
+    return dict(sorted(results.items(), key=lambda item: item[1]['plays'], reverse=True))
+
+
+def load_player_stats(path):
+    """Player card stats for the play log at `path`, computed once per file version."""
+    return derived(path, 'player_stats', compute_player_stats)
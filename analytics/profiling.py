@@ -0,0 +1,152 @@
+import contextlib
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+# GTFA_PROFILE=1 profiles every run; GTFA_PROFILE=url only runs opened with ?profile=1.
+# Unset, the url flag is ignored so visitors can't switch tracing on for the whole process.
+ENV_FLAG = 'GTFA_PROFILE'
+LOG_PATH = './logs/profile.jsonl'
+
+# Each Streamlit session reruns its page on its own thread
+_local = threading.local()
+_log_lock = threading.Lock()
+
+# tracemalloc is process-wide: it runs while any profiled run is open, and stops after the
+# last one unless something else had already started it
+_tracing_lock = threading.Lock()
+_tracing = {'runs': 0, 'owned': False}
+
+
+def _query_flag():
+    try:
+        import streamlit as st
+        return st.query_params.get('profile') == '1'
+    except Exception:
+        return False
+
+
+def _enabled():
+    flag = os.environ.get(ENV_FLAG)
+    return flag == '1' or (flag == 'url' and _query_flag())
+
+
+def _acquire_tracing():
+    with _tracing_lock:
+        if _tracing['runs'] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing['owned'] = True
+        _tracing['runs'] += 1
+
+
+def _release_tracing():
+    with _tracing_lock:
+        _tracing['runs'] -= 1
+        if _tracing['runs'] == 0 and _tracing['owned']:
+            tracemalloc.stop()
+            _tracing['owned'] = False
+
+
+def start_run(page):
+    """Begin collecting timings for one page run; no-op unless profiling is switched on."""
+    if _current() is not None:
+        # The last run on this thread never finished (e.g. an exception); let its tracing go
+        _release_tracing()
+    if not _enabled():
+        _local.run = None
+        return
+    _acquire_tracing()
+    _local.run = {'page': page, 'started': time.perf_counter(), 'sections': {}, 'calls': {}}
+
+
+def _current():
+    return getattr(_local, 'run', None)
+
+
+@contextlib.contextmanager
+def section(name):
+    """Time a page region and the memory allocated meanwhile.
+
+    Memory comes from the process-wide tracemalloc counters, so concurrent sessions' allocations are included.
+    """
+    run = _current()
+    if run is None:
+        yield
+        return
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        after, peak = tracemalloc.get_traced_memory()
+        stats = run['sections'].setdefault(name, {'ms': 0.0, 'process_alloc_kb': 0.0, 'process_peak_kb': 0.0})
+        stats['ms'] += elapsed * 1000
+        stats['process_alloc_kb'] += (after - before) / 1024
+        stats['process_peak_kb'] = max(stats['process_peak_kb'], (peak - before) / 1024)
+
+
+def timed(fn):
+    """Count calls and time spent in a helper during the current run."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        run = _current()
+        if run is None:
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stats = run['calls'].setdefault(fn.__qualname__, {'calls': 0, 'ms': 0.0})
+            stats['calls'] += 1
+            stats['ms'] += (time.perf_counter() - start) * 1000
+    return wrapper
+
+
+def _write_log(record, log_path):
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    with _log_lock, open(log_path, 'a') as file:
+        file.write(json.dumps(record) + '\n')
+
+
+def finish_run(log_path=LOG_PATH):
+    """Show the run's breakdown in the sidebar and append it to the json-lines log."""
+    run = _current()
+    if run is None:
+        return None
+    _local.run = None
+    _release_tracing()
+    from analytics.charts import render_cache
+    from analytics.loader import cache_stats
+    store = cache_stats()
+    record = {
+        'ts': datetime.datetime.now().isoformat(timespec='seconds'),
+        'page': run['page'],
+        'total_ms': round((time.perf_counter() - run['started']) * 1000, 2),
+        'sections': {name: {k: round(v, 2) for k, v in stats.items()} for name, stats in run['sections'].items()},
+        'calls': {name: {k: round(v, 2) for k, v in stats.items()} for name, stats in run['calls'].items()},
+        # Shared across sessions, so this is the process's footprint, not the run's
+        'memory': {'games': store['games'], 'entries': store['entries'], 'store_mb': round(store['mb'], 2), 'limit_mb': store['limit_mb'], 'renders_mb': round(render_cache.bytes / 1e6, 2)},
+    }
+    try:
+        _write_log(record, log_path)
+    except OSError:
+        pass
+
+    import pandas as pd
+    import streamlit as st
+    with st.sidebar.expander('profile', expanded=True):
+        st.metric('run (ms)', record['total_ms'])
+        memory = record['memory']
+        st.caption(f"shared store: {memory['entries']} entries ({memory['games']} games), {memory['store_mb']}/{memory['limit_mb']:g} MB; renders: {memory['renders_mb']} MB")
+        if record['sections']:
+            st.caption('process_* memory includes any other session running at the same time')
+            st.dataframe(pd.DataFrame(record['sections']).T, use_container_width=True)
+        if record['calls']:
+            st.dataframe(pd.DataFrame(record['calls']).T, use_container_width=True)
+    return record
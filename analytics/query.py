@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+from analytics.games import DATA_DIR
+from analytics.loader import memoize
+from analytics.metrics import bool_flags, efficient_mask
+from analytics.season import load_season, play_logs, season_version
+from analytics.situations import TERRITORIES, territory
+from analytics.value import BANDS, FIELD_BAND, YTG_BUCKETS, field_band, load_value_model, ytg_bucket
+
+# Filterable dimensions, each indexed with one bitmap per value
+DIMENSIONS = ['game', 'down', 'ytg', 'field_band', 'territory', 'player', 'action']
+
+FIELD_BANDS = [f'{band * FIELD_BAND}-{band * FIELD_BAND + FIELD_BAND - 1}' for band in range(BANDS - 1)] + [f'{(BANDS - 1) * FIELD_BAND}-100']
+
+# Columns of an aggregated slice
+RESULT_COLUMNS = ['plays', 'yds', 'avg_yds', 'success_rate', 'conversion_rate', 'epa_per_play']
+
+
+def _codes(plays):
+    # (labels, int code of every play) per dimension
+    down = plays['down'].to_numpy(dtype=int)
+    return {
+        'game': (plays['game'].cat.categories.tolist(), plays['game'].cat.codes.to_numpy()),
+        'down': ([1, 2, 3, 4], down - 1),
+        'ytg': (YTG_BUCKETS, ytg_bucket(plays['ytg'])),
+        'field_band': (FIELD_BANDS, field_band(plays['field_pos'])),
+        'territory': (list(TERRITORIES), pd.Categorical(territory(plays['field_pos']), categories=list(TERRITORIES)).codes),
+        'player': (plays['player'].cat.categories.tolist(), plays['player'].cat.codes.to_numpy()),
+        'action': (plays['action'].cat.categories.tolist(), plays['action'].cat.codes.to_numpy()),
+    }
+
+
+def build_index(plays, values=None):
+    """Packed bitmaps (one bit per play) for every value of every dimension, plus the per-play measures."""
+    bitmaps = {}
+    for dim, (labels, codes) in _codes(plays).items():
+        bitmaps[dim] = {label: np.packbits(codes == code) for code, label in enumerate(labels)}
+    measures = pd.DataFrame({
+        'game': plays['game'],
+        'down': plays['down'],
+        'player': plays['player'],
+        'action': plays['action'],
+        'yds': plays['yds'].to_numpy(dtype=float),
+        'success': efficient_mask(plays),
+        'converted': bool_flags(plays, 'converted'),
+        'epa': values['epa'].to_numpy() if values is not None else np.nan,
+    }, index=plays.index)
+    measures['ytg'] = pd.Categorical.from_codes(ytg_bucket(plays['ytg']), YTG_BUCKETS)
+    measures['field_band'] = pd.Categorical.from_codes(field_band(plays['field_pos']), FIELD_BANDS)
+    measures['territory'] = pd.Categorical(territory(plays['field_pos']), categories=list(TERRITORIES))
+    return {'n': len(plays), 'bitmaps': bitmaps, 'measures': measures}
+
+
+def select(index, **filters):
+    """Row positions matching every filter; each filter is a list of values, any of which may match.
+
+    select(index, down=[3], ytg=['1-3'], field_band=['60-69', '70-79'], player=['haynes'])
+    """
+    bitmaps = index['bitmaps']
+    mask = None
+    for dim, wanted in filters.items():
+        if dim not in bitmaps:
+            raise ValueError(f'unknown dimension {dim!r}, expected one of {DIMENSIONS}')
+        if not wanted:
+            continue
+        empty = np.zeros((index['n'] + 7) // 8, dtype=np.uint8)
+        either = np.bitwise_or.reduce([bitmaps[dim].get(value, empty) for value in wanted])
+        mask = either if mask is None else mask & either
+    if mask is None:
+        return np.arange(index['n'])
+    return np.flatnonzero(np.unpackbits(mask, count=index['n']))
+
+
+def aggregate(index, rows, by=()):
+    """Plays, yardage, success, conversion and EPA for the selected rows, optionally grouped."""
+    frame = index['measures'].iloc[rows]
+    grouped = frame.groupby(list(by), observed=True, sort=False) if by else frame.groupby(np.zeros(len(frame), dtype=int))
+    result = pd.DataFrame({
+        'plays': grouped.size(),
+        'yds': grouped['yds'].sum(),
+        'avg_yds': grouped['yds'].mean(),
+        'success_rate': grouped['success'].mean(),
+        'conversion_rate': grouped['converted'].mean(),
+        'epa_per_play': grouped['epa'].mean(),
+    })[RESULT_COLUMNS]
+    return result.sort_values('plays', ascending=False, kind='stable') if by else result.reset_index(drop=True)
+
+
+def load_query_index(data_dir=DATA_DIR):
+    """Bitmap index over the season play table, built once per season version."""
+    # Rebuilt when any log changes
+    build = lambda: build_index(load_season(data_dir)['plays'], load_value_model(data_dir)['values'])
+    return memoize(('query_index', data_dir), season_version(play_logs(data_dir)), build)
+
+
+def query(by=(), data_dir=DATA_DIR, **filters):
+    """Aggregate the season plays matching `filters`, grouped by `by`."""
+    index = load_query_index(data_dir)
+    return aggregate(index, select(index, **filters), by)
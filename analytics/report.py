@@ -0,0 +1,437 @@
+import math
+import os
+
+import streamlit as st 
+import plotly.graph_objects as go
+from streamlit_extras.stylable_container import stylable_container
+from streamlit_extras.add_vertical_space import add_vertical_space
+
+from analytics import profiling, warmup
+from analytics.bootstrap import CONFIDENCE, load_player_intervals, load_team_intervals
+from analytics.charts import create_semi_circular_gauge, pyplot_png
+from analytics.drives import drive_summary, load_drives
+from analytics.figures import card_gauges, draw_avg_yds, draw_team_graph, draw_yds, yds_charts
+from analytics.games import PLAYER_NOTES, SITUATION_NOTES, has_play_log, play_log
+from analytics.headshots import headshot_html
+from analytics.live import live_game
+from analytics.loader import load_plays
+from analytics.metrics import load_team_metrics
+from analytics.players import load_player_stats
+from analytics.roster import ACTIONS, starting_qb
+from analytics.series import load_team_series
+from analytics.situations import TERRITORIES, load_situations, situation_captions, situation_table
+from analytics.validate import PlayLogError
+from analytics.value import game_values
+
+# Define notes file path
+NOTES_FILE_PATH = "notes.txt"
+# Serve headshots from ./static instead of inlining them; needs enableStaticServing in .streamlit/config.toml
+STATIC_HEADSHOTS = False
+# Live play entry is opt-in: GTFA_EDITOR=1
+EDITOR_ENABLED = os.environ.get('GTFA_EDITOR') == '1'
+
+#region styling
+
+def _styling():
+    st.markdown("""
+    <style>
+
+    	.stTabs [data-baseweb="tab-list"] {
+    		gap: 20px;
+        }
+    	.stTabs [data-baseweb="tab"] {
+    		height: 50px;
+            width: 100px;
+            white-space: pre-wrap;
+    		background-color: #F0F2F6;
+    		border-radius: 4px 4px 0px 0px;
+    		gap: 1px;
+    		padding-top: 10px;
+    		padding-bottom: 10px;
+        }
+    	.stTabs [aria-selected="true"] {
+      		background-color: #FFFFFF;
+    	}
+ 
+        section[data-testid="stSidebar"] {
+            width: 310px !important;
+        }
+        .st-emotion-cache-1i55tjj {
+            display: none;
+        } 
+        .css-1nm2qww {
+            display: none;
+        }
+        .css-vk3wp9 {
+            min-width: 309px;
+            max-width: 310px;
+        }
+
+    </style>""", unsafe_allow_html=True)
+
+#endregion
+
+#region functions
+
+def lazy_tabs(labels, key):
+    # Unlike st.tabs, which runs every tab on each rerun, only the selected label gets rendered
+    return st.radio(key, labels, horizontal=True, key=key, label_visibility='collapsed')
+
+def metric_value(value):
+    # NaN marks a metric the log can't support, e.g. yd_contribution without the contributed column
+    return 'N/A' if isinstance(value, float) and math.isnan(value) else round(value, 2)
+
+# Read notes from the file
+def load_notes(file_path):
+    try:
+        with open(file_path, "r") as file:
+            notes = file.readlines()
+            return [note.strip() for note in notes]
+    except FileNotFoundError:
+        return ["Notes file not found. Please check the file path."]
+    
+
+@profiling.timed
+def create_circular_progress_bar(percentage, title_input, color_input):
+    # Ensure a fresh figure every time
+    fig = go.Figure()
+
+    # Determine the color based on input
+    color = '#0afa46' if color_input == 'green' else (
+        '#2499ff' if color_input == 'blue' else '#e38c00'
+    )
+
+    # Calculate the progress and remainder explicitly
+    progress_value = percentage
+    remainder_value = 100 - percentage
+
+    # Add a single trace to control both progress and remainder
+    fig.add_trace(go.Pie(
+        values=[progress_value, remainder_value],
+        hole=0.7,
+        marker=dict(
+            colors=[color, '#e6e5e3'],  # Progress color and gray for remainder
+            line=dict(color='black', width=1)  # Black outline
+        ),
+        direction='counterclockwise',  # Force clockwise direction
+        rotation=0,  # Start at the bottom
+        showlegend=False,
+        textinfo='none'
+    ))
+
+    # Update layout to make the background transparent and add a title
+    fig.update_layout(
+        title={
+            'text': f"{title_input}: {percentage}%",
+            'y': 0.95,  # Position the title closer to the top
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': {
+                'color': 'gray',  # Gray color for the title
+                'size': 12        # Smaller font size
+            }
+        },
+        margin=dict(t=20, b=5, l=0, r=0),
+        width=80,  # Adjust size for better alignment
+        height=80,
+        paper_bgcolor="rgba(0,0,0,0)"  # Transparent background
+    )
+    
+
+    return fig
+
+#endregion
+
+#region editor
+
+def _editor(path):
+    # Live play entry: each play is appended to the log and folded into running stats
+    game = live_game(path)
+    cols = st.columns([0.1,0.4,0.2,0.3])
+    with cols[1]:
+        with st.form('play_entry', clear_on_submit=True):
+            down = st.number_input('down', min_value=1, max_value=4, value=1)
+            ytg = st.number_input('ytg', min_value=0.1, max_value=100.0, value=10.0)
+            field_pos = st.number_input('field_pos', min_value=0, max_value=100, value=25)
+            player = st.text_input('player')
+            action = st.radio('action', ACTIONS, horizontal=True)
+            completed = st.checkbox('completed')
+            yds = st.number_input('yds', min_value=-99.0, max_value=99.0, value=0.0)
+            converted = st.checkbox('converted')
+            contributed = st.checkbox('contributed')
+            if st.form_submit_button('Log play'):
+                if not player.strip():
+                    st.error('player is required')
+                else:
+                    try:
+                        game.append({
+                            'down': down, 'ytg': ytg, 'field_pos': field_pos, 'player': player, 'action': action,
+                            'completed': completed, 'yds': yds, 'converted': converted, 'contributed': contributed,
+                        })
+                    except ValueError as e:
+                        st.error(str(e))
+    metrics = game.team_metrics()
+    with cols[2]:
+        for metric in ('plays', 'total_yds', 'offensive_efficacy', 'third_conversion_rate'):
+            st.metric(label=metric, value=metric_value(metrics[metric]))
+    with cols[3]:
+        st.line_chart(game.team_series())
+
+#endregion
+
+#region dashboard
+
+def _dashboard(path):
+    add_vertical_space(2)
+    tab = lazy_tabs(['team_metrics','team_graphs','drives'], 'dashboard_tab')
+    
+    if tab == 'team_metrics':
+        metrics = load_team_metrics(path)
+        intervals = load_team_intervals(path)
+        cont_cols = st.columns([0.13,0.13,0.13,0.13,0.48])
+        for i,metric in enumerate(metrics.keys()):
+            with cont_cols[i%4]:
+                with stylable_container(
+                    key=f"container_with_border_{metric}",
+                    css_styles="""
+                        {
+                            border: 2px solid rgba(100, 100, 100, 0.5);
+                            border-radius: 0.5rem;
+                            padding: calc(1em - 1px)
+                            
+                        }
+                        """,
+                    ):
+                    st.metric(label=metric,value=metric_value(metrics[metric]))
+                    if metric in intervals.index and intervals.loc[metric].notna().all():
+                        low, high = intervals.loc[metric]
+                        st.caption(f'{CONFIDENCE:.0%} CI {low:.2f} - {high:.2f}')
+
+        legend = [
+            'an efficient movement advances the ball >= 5 yds or converts',
+            'offensive efficacy = number of efficient movements / total plays',
+            'pass efficiency = efficient passes / attempts',
+            'rush efficiency = efficient rushes / attempts',
+            'yd contribution = positive yds leading to a score / total positive yds' 
+        ]
+
+        with cont_cols[4]:
+            with stylable_container(
+                    key="container_with_border_black",
+                    css_styles="""
+                        {
+                            border: 1px solid rgba(100, 100, 100, 0.5);
+                            border-radius: 0.5rem;
+                            padding: 10px;
+                        }
+                        """,
+                ):
+                    st.markdown(f"<h3 style='text-align: center; color: black; font-size: 14px;'>Notes</p>", unsafe_allow_html=True)
+                    for i in legend:
+                        st.info(i)
+                    add_vertical_space(2)   
+        
+    elif tab == 'team_graphs':
+        df_team_graph = load_team_series(path)
+        cont_cols = st.columns([0.05,0.3,0.3,0.3,0.05])
+        
+        with cont_cols[1]:
+            st.image(pyplot_png(draw_team_graph, df_team_graph), use_container_width=True)
+
+    elif tab == 'drives':
+        drives = load_drives(path)
+        summary = drive_summary(drives)
+        cont_cols = st.columns([0.13,0.13,0.13,0.13,0.48])
+        for i,metric in enumerate(summary.keys()):
+            with cont_cols[i%4]:
+                st.metric(label=metric,value=metric_value(summary[metric]))
+        with cont_cols[4]:
+            st.dataframe(drives, use_container_width=True)
+
+#endregion
+
+#region off_playbook
+
+def _off_playbook(game, path, data):
+    add_vertical_space(2)
+    tab = lazy_tabs(list(TERRITORIES) + ['all_plays'], 'off_playbook_tab')
+    
+    if tab in TERRITORIES:
+        terr = tab
+        situations = load_situations(path)
+        # Hand notes shown under the generated captions
+        coach_notes = SITUATION_NOTES.get(game, {})
+        for down, space in ((1, 2), (3, 1)):
+            cols = st.container().columns([0.01,0.49,0.49,0.01])
+            with cols[1]:
+                st.table(situation_table(situations, terr, down))
+            with cols[2]:
+                add_vertical_space(space)
+                for level, caption in situation_captions(situations, terr, down):
+                    getattr(st, level)(caption)
+                if (terr, down) in coach_notes:
+                    st.info(coach_notes[(terr, down)])
+
+    elif tab == 'all_plays':
+        cols = st.columns([0.01,0.98,0.01])
+        with cols[1]:
+            st.dataframe(data.join(game_values(game)), use_container_width=True, height=600)
+
+#endregion
+
+#region player_eval
+
+def _player_eval(game, path, data, passer):
+    add_vertical_space(2)
+    tab = lazy_tabs(["player cards","yds/t","avg yds/t"], 'player_eval_tab')
+    
+    if tab == "player cards":
+        player_cards_container = st.container()
+        with player_cards_container:
+            cols = st.columns([0.3,0.3,0.3])
+            sorted_data = load_player_stats(path)
+            intervals = load_player_intervals(path)
+
+            for i,player in enumerate(sorted_data):  
+                with cols[i%3]:  
+                    with stylable_container(
+                        key=f"container_with_border_{player}",
+                        css_styles="""
+                            {
+                                border: 2px solid rgba(100, 100, 100, 0.5);
+                                border-radius: 0.5rem;
+                                padding: calc(1em - 1px)
+                                
+                            }
+                            """,
+                        ):
+                        container_cols = st.columns([0.05,0.45,0.45,0.05])
+                        with container_cols[1]:
+                            add_vertical_space(1)
+                            st.markdown(f"<p style='text-align: center; color: black; font-size: 14px;'>{player}</p>", unsafe_allow_html=True)
+                            st.markdown(headshot_html(player, static=STATIC_HEADSHOTS), unsafe_allow_html=True)
+                            add_vertical_space(3)
+                            
+                        with container_cols[2]:
+                            add_vertical_space(2)
+                            st.write(sorted_data[player])
+                        
+                        
+                        for slot, label, percentage, title, color in card_gauges(sorted_data[player], player == passer):
+                            col = container_cols[1] if slot == 'cmp' else container_cols[2]
+                            col.markdown(f"<p style='text-align: center; color: black; font-size: 14px;'>{label}</p>", unsafe_allow_html=True)
+                            fig = create_semi_circular_gauge(percentage, title, color)
+                            col.plotly_chart(fig,use_container_width=True,key=player+slot,theme=None)
+                            if intervals[player][slot] is not None:
+                                low, high = intervals[player][slot]
+                                col.markdown(f"<p style='text-align: center; color: gray; font-size: 12px;'>{CONFIDENCE:.0%} CI {low:.0f}% - {high:.0f}%</p>", unsafe_allow_html=True)
+                            add_vertical_space(1)
+                        
+    elif tab == "yds/t":
+        cols = st.columns([0.05,0.3,0.3,0.3,0.05])
+        df = data
+        skill_players = df['player'].unique().tolist()
+        
+        player_notes = PLAYER_NOTES.get(game, {})
+        
+        
+        with cols[3]:
+            add_vertical_space(1)
+            with stylable_container(
+                    key="container_with_border_black",
+                    css_styles="""
+                        {
+                            border: 1px solid rgba(100, 100, 100, 0.5);
+                            border-radius: 0.5rem;
+                            padding: 10px;
+                        }
+                        """,
+                ):
+                    add_vertical_space(1)   
+                    st.markdown(f"<h3 style='text-align: center; color: black; font-size: 14px;'>Notes</p>", unsafe_allow_html=True)
+                    for player in skill_players:
+                        if player in player_notes.keys():
+                            if player_notes[player][0] == 'green':
+                                st.success(player+': '+player_notes[player][1])
+                            elif player_notes[player][0] == 'yellow':
+                                st.warning(player+': '+player_notes[player][1])
+                            else:
+                                st.error(player+': '+player_notes[player][1]) 
+                    add_vertical_space(2)            
+                    
+             
+             
+        for i, (player, player_yds, passing_yds) in enumerate(yds_charts(df, passer)):
+            with cols[(i%2)+1]:
+                st.image(pyplot_png(draw_yds, player_yds, passing_yds, len(df), player), use_container_width=True)
+    
+    elif tab == "avg yds/t":
+        top = st.container()
+        mid = st.container()
+        bot = st.container()
+        top_cols = top.columns([0.05,0.3,0.3,0.3,0.05])
+        mid_cols = mid.columns([0.05,0.3,0.3,0.3,0.05])
+        bot_cols = bot.columns([0.05,0.3,0.3,0.3,0.05])
+        df = data
+        
+        # Top Row Notes
+        
+        for i, (player, player_yds, passing_yds) in enumerate(yds_charts(df, passer)):
+            with mid_cols[(i%3)+1]:
+                st.image(pyplot_png(draw_avg_yds, player_yds, passing_yds, len(df), player), use_container_width=True)
+
+#endregion
+
+def render_game(game):
+    """Full game report for `game` (one of analytics.games.GAMES), or a placeholder until its play log lands."""
+    st.set_page_config(layout='wide')
+    # Whichever page a session lands on first kicks off warming the rest
+    warmup.start()
+    if not has_play_log(game):
+        st.warning('In Progress')
+        # Live mode can start the log from here; the editor takes over once it exists
+        if EDITOR_ENABLED and st.button('Start live log'):
+            live_game(play_log(game))
+            st.rerun()
+        return
+
+    profiling.start_run(game)
+    path = play_log(game)
+    with profiling.section('load'):
+        try:
+            data = load_plays(path)
+        except PlayLogError as e:
+            # Bad rows are reported once here instead of failing somewhere inside a section
+            st.error(str(e))
+            profiling.finish_run()
+            return
+    passer = starting_qb()
+
+    _styling()
+
+    header = st.container()
+    header_cols = header.columns(5)
+    notes = load_notes(NOTES_FILE_PATH)
+        
+    with header_cols[0].popover('ℹ️Info', use_container_width=True):
+        for note in notes:
+            st.warning('* '+note)
+            
+    if EDITOR_ENABLED:
+        with st.expander('editor'):
+            _editor(path)
+    # Only the open section is computed and sent; nothing below the header until one is picked
+    section = st.radio('section', ['dashboard', 'offensive review', 'offensive player eval'], index=None, horizontal=True, key='section', label_visibility='collapsed')
+
+    if section == 'dashboard':
+        with profiling.section('dashboard'):
+            _dashboard(path)
+    elif section == 'offensive review':
+        with profiling.section('off_playbook'):
+            _off_playbook(game, path, data)
+    elif section == 'offensive player eval':
+        with profiling.section('player_eval'):
+            _player_eval(game, path, data, passer)
+
+    profiling.finish_run()
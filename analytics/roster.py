@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+
+PICS_DIR = './pics'
+
+# Everyone who shows up in a play log. A player's id is their position in this
+# dict, which is also their category code in the player column, so only ever add
+# players at the end. Position is only filled in where it changes how the log is
+# read: the log records the receiver on passing plays, so passing stats go to the QB.
+ROSTER = {
+    'king': {'position': 'QB', 'jersey': None},
+    'pyron': {'position': 'QB2', 'jersey': None},
+    'haynes': {'position': None, 'jersey': None},
+    'rutherford': {'position': None, 'jersey': None},
+    'singleton': {'position': None, 'jersey': None},
+    'alexander': {'position': None, 'jersey': None},
+    'boyd': {'position': None, 'jersey': None},
+    'carrie': {'position': None, 'jersey': None},
+    'lane': {'position': None, 'jersey': None},
+    'beetham': {'position': None, 'jersey': None},
+    'goede': {'position': None, 'jersey': None},
+    'hawes': {'position': None, 'jersey': None},
+    'leary': {'position': None, 'jersey': None},
+    'stockton': {'position': None, 'jersey': None},
+}
+
+ACTIONS = ('rec', 'rush')
+
+ACTION_DTYPE = pd.CategoricalDtype(list(ACTIONS))
+
+
+def starting_qb():
+    return next(name for name, player in ROSTER.items() if player['position'] == 'QB')
+
+
+def player_id(name):
+    # Only registered players have an id; anyone else needs adding to ROSTER first
+    if name not in ROSTER:
+        raise ValueError(f'{name!r} is not in the roster')
+    return list(ROSTER).index(name)
+
+
+def headshot_path(name):
+    return os.path.join(PICS_DIR, name + '.jpg')
+
+
+def player_dtype(names=()):
+    """Player categories: the roster in id order, then any unregistered names sorted.
+
+    Unregistered names have no id: their codes depend on which other unknown names are in
+    the same frame, so they are only meaningful within it.
+    """
+    extra = sorted(set(names) - set(ROSTER))
+    return pd.CategoricalDtype(list(ROSTER) + extra)
+
+
+def encode_plays(plays):
+    """Recode player/action onto the registry categories; a registered player's code is their id in every log."""
+    plays['player'] = plays['player'].astype(player_dtype(plays['player'].dropna().unique()))
+    plays['action'] = plays['action'].astype(ACTION_DTYPE)
+    return plays
+
+
+def roster_table():
+    """Registry as a frame indexed by player id."""
+    table = pd.DataFrame.from_dict(ROSTER, orient='index').rename_axis('name').reset_index()
+    table['headshot'] = table['name'].map(headshot_path)
+    return table.rename_axis('id')
@@ -0,0 +1,15 @@
+# Column order of a play log as written by the editor
+PLAY_COLUMNS = ['down', 'ytg', 'field_pos', 'player', 'action', 'completed', 'yds', 'converted', 'contributed']
+
+# Pinned dtypes so every page sees the same schema regardless of how the csv was written
+PLAY_DTYPES = {
+    'down': 'int8',
+    'ytg': 'float32',
+    'field_pos': 'int8',
+    'player': 'category',
+    'action': 'category',
+    'completed': 'boolean',
+    'yds': 'float64',
+    'converted': 'boolean',
+    'contributed': 'boolean',
+}
@@ -0,0 +1,83 @@
+import glob
+import os
+
+import pandas as pd
+
+from analytics.games import DATA_DIR, GAMES
+from analytics.compare import compute_metric_matrix
+from analytics.loader import load_plays, memoize
+from analytics.metrics import TEAM_METRICS
+from analytics.players import PLAYER_STATS, load_player_stats
+from analytics.roster import encode_plays
+from analytics.schema import PLAY_COLUMNS, PLAY_DTYPES
+
+
+def game_id(path):
+    # ./data/FSU-GT-08-24-24-PLAYS -> FSU-GT-08-24-24
+    return os.path.basename(path)[:-len('-PLAYS')]
+
+
+def play_logs(data_dir=DATA_DIR):
+    # Schedule order, so the season table is chronological; unscheduled logs go last
+    schedule = list(GAMES)
+    def order(path):
+        game = game_id(path)
+        return (schedule.index(game) if game in schedule else len(schedule), game)
+    return sorted(glob.glob(os.path.join(data_dir, '*-PLAYS')), key=order)
+
+
+def _build(paths):
+    games = [game_id(path) for path in paths]
+    frames = []
+    for game, path in zip(games, paths):
+        plays = load_plays(path)
+        plays.insert(0, 'game', game)
+        frames.append(plays)
+    if frames:
+        plays = pd.concat(frames, ignore_index=True)
+    else:
+        # Same schema as a loaded log, so everything built on the season table just comes out empty
+        plays = pd.DataFrame({col: pd.Series(dtype=PLAY_DTYPES[col]) for col in PLAY_COLUMNS})
+        plays.insert(0, 'game', pd.Series(dtype=object))
+    # Logs with unregistered players carry extra categories, so re-intern after concatenating
+    plays['game'] = plays['game'].astype(pd.CategoricalDtype(games))
+    encode_plays(plays)
+
+    # One grouped pass over every game instead of a dashboard computation per log
+    if frames:
+        metrics = compute_metric_matrix(plays)
+    else:
+        metrics = pd.DataFrame(columns=TEAM_METRICS, index=pd.Index([], name='game'))
+
+    rows = []
+    for game, path in zip(games, paths):
+        for player, stats in load_player_stats(path).items():
+            rows.append({'game': game, 'player': player, **stats})
+    players = pd.DataFrame(rows, columns=['game', 'player'] + PLAYER_STATS)
+
+    return {'plays': plays, 'metrics': metrics, 'players': players}
+
+
+def season_version(paths):
+    # Changes whenever a log is added, removed or rewritten
+    return tuple((os.path.abspath(path), os.path.getmtime(path)) for path in paths)
+
+
+def load_season(data_dir=DATA_DIR):
+    """Game-keyed play table plus per-game metric and player rows for every log in `data_dir`."""
+    paths = play_logs(data_dir)
+    # Rebuilt only when the set of logs or one of their mtimes changes; unchanged games come from the per-file caches
+    return memoize(('season', data_dir), season_version(paths), lambda: _build(paths))
+
+
+def season_metrics(data_dir=DATA_DIR):
+    """Games x team metrics."""
+    return load_season(data_dir)['metrics']
+
+
+def season_player_totals(data_dir=DATA_DIR):
+    """Player card stats summed over every game, ordered by plays."""
+    players = load_season(data_dir)['players']
+    totals = players.groupby('player', sort=False)[PLAYER_STATS].sum()
+    totals['games'] = players.groupby('player', sort=False).size()
+    return totals.sort_values('plays', ascending=False, kind='stable')
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from analytics.loader import derived
+from analytics.metrics import bool_flags, efficient_mask, tracks_contribution
+
+
+def compute_team_series(plays):
+    """Running efficient movement % and yd contribution % after each play."""
+    yds = plays['yds'].fillna(0).to_numpy(dtype=float)
+    n_plays = np.arange(1, len(yds) + 1)
+    efficiency = np.cumsum(efficient_mask(plays)) / n_plays
+    positive_total = np.cumsum(np.clip(yds, 0, None))
+    contributing_total = np.cumsum(np.where(bool_flags(plays, 'contributed'), yds, 0.0))
+    # Undefined until the offense has gained a positive yard and some play so far records contributed
+    tracked = np.cumsum(tracks_contribution(plays)) > 0
+    contributing_pct = np.divide(contributing_total, positive_total, out=np.full(len(yds), np.nan), where=(positive_total > 0) & tracked)
+    return pd.DataFrame({'efficiency': efficiency, 'contributing_yds%': contributing_pct}, index=plays.index)
+
+
+def load_team_series(path):
+    """Team efficiency series for the play log at `path`, computed once per file version."""
+    return derived(path, 'team_series', compute_team_series)
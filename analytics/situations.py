@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from analytics.loader import derived
+from analytics.metrics import bool_flags, efficient_mask
+from analytics.schema import PLAY_COLUMNS
+
+# Field position bands: own side of midfield, midfield to the red zone, red zone
+TERRITORIES = {
+    'gt_terr': (0, 50, 'in GT territory'),
+    'opp_terr': (50, 80, 'in between midfield and the red zone'),
+    'red_zone': (80, 101, 'in the red zone'),
+}
+
+# Columns shown in the situational tables
+TABLE_COLUMNS = [col for col in PLAY_COLUMNS if col != 'contributed']
+
+# Caption level cutoffs per stat: >= first is success, >= second is warning, else error
+CAPTION_LEVELS = {
+    'completed': (0.6, 0.4),
+    'eff_car': (0.5, 0.35),
+    'efficient': (0.5, 0.4),
+    'converted': (0.35, 0.2),
+}
+
+ORDINALS = {1: '1st', 2: '2nd', 3: '3rd', 4: '4th'}
+
+
+def territory(field_pos):
+    field_pos = np.asarray(field_pos)
+    names = list(TERRITORIES)
+    bands = [(field_pos >= low) & (field_pos < high) for low, high, _ in TERRITORIES.values()]
+    return np.select(bands, names, default=names[-1])
+
+
+def compute_situations(plays):
+    """Bucket every play once by (territory, down, action) and keep each bucket's counts and sorted table."""
+    is_pass = (plays['action'] == 'rec').to_numpy()
+    frame = plays[TABLE_COLUMNS].copy()
+    frame['territory'] = pd.Categorical(territory(plays['field_pos']), categories=list(TERRITORIES))
+    frame['n'] = 1
+    frame['completed_n'] = is_pass & bool_flags(plays, 'completed')
+    frame['efficient_n'] = efficient_mask(plays)
+    frame['converted_n'] = bool_flags(plays, 'converted')
+
+    counts = (
+        frame.groupby(['territory', 'down', 'action'], observed=True)[['n', 'completed_n', 'efficient_n', 'converted_n', 'yds']]
+        .sum()
+        .rename(columns=lambda col: col[:-2] if col.endswith('_n') else col)
+    )
+
+    ordered = frame.sort_values(['territory', 'down', 'action', 'yds'], kind='stable')
+    tables = {
+        (terr, int(down)): table[TABLE_COLUMNS]
+        for (terr, down), table in ordered.groupby(['territory', 'down'], observed=True, sort=False)
+    }
+    return {'counts': counts, 'tables': tables}
+
+
+def load_situations(path):
+    """Situational index for the play log at `path`, computed once per file version."""
+    return derived(path, 'situations', compute_situations)
+
+
+def situation_table(situations, terr, down):
+    return situations['tables'].get((terr, down), pd.DataFrame(columns=TABLE_COLUMNS))
+
+
+def _level(stat, num, den):
+    good, ok = CAPTION_LEVELS[stat]
+    rate = num / den
+    return 'success' if rate >= good else ('warning' if rate >= ok else 'error')
+
+
+def _pct(num, den):
+    return f'{round(num / den * 100, 1):g}%'
+
+
+def situation_captions(situations, terr, down):
+    """(level, text) captions for one territory and down, built from the bucket counts."""
+    counts = situations['counts']
+    if (terr, down) not in counts.index.droplevel('action'):
+        return []
+    bucket = counts.loc[(terr, down)]
+    where = f"on {ORDINALS.get(down, down)} down {TERRITORIES[terr][2]}"
+    total = bucket.sum()
+    plays = int(total['n'])
+
+    captions = []
+    if 'rec' in bucket.index:
+        passes, completed = int(bucket.loc['rec', 'n']), int(bucket.loc['rec', 'completed'])
+        captions.append((_level('completed', completed, passes), f'{completed}/{passes} passes completed ({_pct(completed, passes)}) {where}.'))
+    else:
+        captions.append(('warning', f"0 passes in {plays} play{'s' if plays != 1 else ''} {where}."))
+    if 'rush' in bucket.index:
+        carries, effective = int(bucket.loc['rush', 'n']), int(bucket.loc['rush', 'efficient'])
+        captions.append((_level('eff_car', effective, carries), f'{effective}/{carries} effective carries ({_pct(effective, carries)}) {where}.'))
+    efficient, converted = int(total['efficient']), int(total['converted'])
+    captions.append((_level('efficient', efficient, plays), f'{efficient}/{plays} efficient movements ({_pct(efficient, plays)}) of the ball {where}.'))
+    captions.append((_level('converted', converted, plays), f'{converted}/{plays} conversions ({_pct(converted, plays)}) {where}.'))
+    return captions
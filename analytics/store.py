@@ -0,0 +1,70 @@
+import os
+import threading
+
+import pyarrow as pa
+
+from analytics.validate import CHUNK_SIZE, PlayLogError, read_play_log
+
+# Bump whenever PLAY_COLUMNS / PLAY_DTYPES or how plays are validated and normalized change,
+# so stale store files get rebuilt
+SCHEMA_VERSION = '3'
+_VERSION_KEY = b'schema_version'
+
+
+def store_path(csv_path, store_dir=None):
+    """Columnar copy of a csv play log: data/<game>-PLAYS -> data/store/<game>-PLAYS.arrow"""
+    csv_path = os.path.abspath(csv_path)
+    store_dir = store_dir or os.path.join(os.path.dirname(csv_path), 'store')
+    return os.path.join(store_dir, os.path.basename(csv_path) + '.arrow')
+
+
+def is_fresh(csv_path, store_dir=None):
+    path = store_path(csv_path, store_dir)
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(csv_path):
+        return False
+    try:
+        with pa.memory_map(path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        # Unreadable (e.g. truncated): the loader falls back to the csv and rewrites it
+        return False
+    return metadata.get(_VERSION_KEY) == SCHEMA_VERSION.encode()
+
+
+def write_store(plays, csv_path, store_dir=None):
+    """Write one game's plays as a single record batch, atomically replacing any older copy."""
+    path = store_path(csv_path, store_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(plays, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _VERSION_KEY: SCHEMA_VERSION.encode()})
+    # Unique per writer: the warmup pool and a session can build the same game at once
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_store(csv_path, store_dir=None):
+    # Memory-mapped: column buffers are paged in from the file, not parsed
+    with pa.memory_map(store_path(csv_path, store_dir)) as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def ingest(csv_paths, store_dir=None, chunksize=None, check_only=False):
+    """Validate csv play logs and convert the good ones into the columnar store. The csv stays the editable source.
+
+    Returns (written store paths, {csv path: PlayLogError}); a bad log is skipped, never half-written.
+    """
+    written, rejected = [], {}
+    for csv_path in csv_paths:
+        try:
+            plays = read_play_log(csv_path, chunksize or CHUNK_SIZE)
+        except PlayLogError as e:
+            rejected[csv_path] = e
+            continue
+        written.append(store_path(csv_path, store_dir) if check_only else write_store(plays, csv_path, store_dir))
+    return written, rejected
+
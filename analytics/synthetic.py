@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from analytics.schema import PLAY_COLUMNS, PLAY_DTYPES
+
+PLAYERS = ['king', 'haynes', 'rutherford', 'singleton', 'alexander', 'lane', 'boyd', 'pyron', 'hawes', 'stockton']
+
+
+def synthetic_plays(n, seed=0, players=PLAYERS):
+    """Random but plausible plays in the play-log schema, for benchmarks."""
+    rng = np.random.default_rng(seed)
+    is_pass = rng.random(n) < 0.4
+    completed = is_pass & (rng.random(n) < 0.65)
+    yds = np.where(is_pass, np.where(completed, rng.gamma(2.0, 6.0, n).round(), 0.0), rng.normal(4.5, 6.0, n).round()) + 0.0  # no -0.0 in the csv
+    down = rng.choice(np.array([1, 2, 3, 4], dtype='int8'), n, p=[0.45, 0.32, 0.2, 0.03])
+    ytg = np.where(down == 1, 10.0, rng.integers(1, 16, n)).astype('float32')
+    converted = (yds >= ytg) | (rng.random(n) < 0.02)
+
+    plays = pd.DataFrame({
+        'down': down,
+        'ytg': ytg,
+        'field_pos': rng.integers(1, 100, n).astype('int8'),
+        'player': rng.choice(players, n),
+        'action': np.where(is_pass, 'rec', 'rush'),
+        'completed': pd.array(np.where(is_pass, completed, None), dtype='boolean'),
+        'yds': yds,
+        'converted': converted,
+        'contributed': rng.random(n) < 0.6,
+    })
+    return plays[PLAY_COLUMNS].astype(PLAY_DTYPES)
+
+
+def write_synthetic_log(path, n, seed=0):
+    """Write a synthetic play log csv formatted like the ones in ./data."""
+    synthetic_plays(n, seed).to_csv(path, index=False)
+    return path
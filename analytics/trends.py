@@ -0,0 +1,74 @@
+import numpy as np
+
+from analytics.games import DATA_DIR
+from analytics.season import load_season
+
+# Most points a trend chart draws per line, whatever the history length
+POINT_BUDGET = 200
+ROLLING_WINDOW = 10
+
+
+def compute_player_trends(plays, window=ROLLING_WINDOW):
+    """Per-player season play sequence with expanding and rolling yds averages.
+
+    `plays` is the game-keyed season table; every player is handled in the same grouped pass.
+    """
+    frame = plays[['game', 'player', 'action', 'yds']].copy()
+    by_player = frame.groupby('player', sort=False, observed=True)['yds']
+    frame['seq'] = by_player.cumcount()
+    frame['expanding'] = by_player.cumsum() / (frame['seq'] + 1)
+    frame['rolling'] = by_player.transform(lambda yds: yds.rolling(window, min_periods=1).mean())
+    return frame
+
+
+def load_player_trends(data_dir=DATA_DIR, window=ROLLING_WINDOW):
+    return compute_player_trends(load_season(data_dir)['plays'], window)
+
+
+def last_n_games(trends, n):
+    """Rows from the last `n` games in `trends` (filter to one player first for that player's last n)."""
+    if n <= 0:
+        # played[-0:] would be every game
+        return trends.iloc[:0]
+    played = trends['game'].unique().tolist()
+    return trends[trends['game'].isin(played[-n:])]
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the line's shape."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    every = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean() if next_end > end else x[-1]
+        avg_y = y[end:next_end].mean() if next_end > end else y[-1]
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(y, n_buckets):
+    """Indices of each bucket's min and max point, in order."""
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    bucket = np.arange(n) * n_buckets // n
+    order = np.lexsort((y, bucket))
+    starts = np.searchsorted(bucket, np.arange(n_buckets))
+    ends = np.append(starts[1:], n)
+    return np.unique(np.concatenate([order[starts], order[ends - 1]]))
+
+
+def downsample(x, y, budget=POINT_BUDGET, method='lttb'):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    keep = lttb(x, y, budget) if method == 'lttb' else minmax(y, budget // 2)
+    return x[keep], y[keep]
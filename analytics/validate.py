@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from analytics.roster import ACTIONS, encode_plays
+from analytics.schema import PLAY_COLUMNS, PLAY_DTYPES
+
+# Rows read and checked at a time, so a huge log never needs its raw strings in memory at once
+CHUNK_SIZE = 100_000
+# Problems listed per rejected file; validation stops at the first chunk that has any
+MAX_ERRORS = 20
+
+# Older logs (e.g. GAST) predate the contributed column
+OPTIONAL_COLUMNS = {'contributed'}
+
+_FLAGS = {'true': True, 'false': False, '1': True, '0': False, '': None}
+
+
+class PlayLogError(ValueError):
+    """A play log that doesn't match the play schema; `problems` holds (line, message) pairs."""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = problems
+        lines = '\n'.join(f'  line {line}: {message}' for line, message in problems)
+        super().__init__(f'{path}: {len(problems)} bad row(s)\n{lines}')
+
+    def __reduce__(self):
+        # Rebuild from (path, problems) so the error survives a process pool
+        return type(self), (self.path, self.problems)
+
+
+def _numbers(raw):
+    # Arrow's cast is the fast path; only a chunk with junk in it pays for the coercing parse
+    try:
+        return pc.cast(pa.array(raw.array), pa.float64()).to_numpy(zero_copy_only=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float)
+
+
+def _labels(raw):
+    # Few distinct values per column, so clean the categories instead of every row
+    raw = raw.astype('category')
+    cleaned = raw.cat.categories.str.strip().str.lower()
+    if cleaned.is_unique:
+        return raw.cat.rename_categories(cleaned)
+    # e.g. 'King' and 'king ' both present: they merge, so clean row by row
+    return raw.astype(str).str.strip().str.lower().astype('category')
+
+
+def _flags(raw):
+    # True/False/blank (any case); anything else maps to the 'bad' sentinel
+    labels = _labels(raw)
+    return labels.map({label: _FLAGS.get(label, 'bad') for label in labels.cat.categories}).astype(object)
+
+
+def check_chunk(chunk):
+    """Normalized plays plus a list of (row offset, message) for every rule a row breaks."""
+    down = _numbers(chunk['down'])
+    ytg = _numbers(chunk['ytg'])
+    field_pos = _numbers(chunk['field_pos'])
+    yds = _numbers(chunk['yds'])
+    player = _labels(chunk['player'])
+    action = _labels(chunk['action'])
+    completed = _flags(chunk['completed'])
+    converted = _flags(chunk['converted'])
+    contributed = _flags(chunk['contributed']) if 'contributed' in chunk else pd.Series(None, index=chunk.index, dtype=object)
+
+    is_rec = (action == 'rec').to_numpy()
+    rules = [
+        (~np.isin(down, [1, 2, 3, 4]), 'down must be 1-4'),
+        (~((ytg > 0) & (ytg <= 100)), 'ytg must be a number in (0, 100]'),
+        (~((field_pos >= 0) & (field_pos <= 100) & (field_pos == np.round(field_pos))), 'field_pos must be a whole number 0-100'),
+        (np.isnan(yds), 'yds must be a number'),
+        ((player == '').to_numpy(), 'player is blank'),
+        (~action.isin(ACTIONS).to_numpy(), f'action must be one of {ACTIONS}'),
+        ((completed == 'bad').to_numpy() | (converted == 'bad').to_numpy() | (contributed == 'bad').to_numpy(), 'completed/converted/contributed must be True, False or blank'),
+        (is_rec & completed.isna().to_numpy(), 'rec needs completed True or False'),
+        (~is_rec & (completed == True).to_numpy(), 'rush cannot be completed'),
+        (is_rec & (completed == False).to_numpy() & (yds != 0), 'incomplete pass with non-zero yds'),
+        (converted.isna().to_numpy(), 'converted is blank'),
+    ]
+    problems = []
+    for mask, message in rules:
+        problems.extend((int(offset), message) for offset in np.flatnonzero(mask))
+    if problems:
+        return None, sorted(problems)
+
+    plays = pd.DataFrame({
+        'down': down,
+        'ytg': ytg,
+        'field_pos': field_pos,
+        'player': player,
+        'action': action,
+        'completed': completed.where(is_rec, None),
+        'yds': yds,
+        'converted': converted,
+        'contributed': contributed,
+    }, index=chunk.index)
+    return plays.astype(PLAY_DTYPES), []
+
+
+def read_play_log(path, chunksize=CHUNK_SIZE):
+    """Stream a csv play log in chunks, validating and normalizing each; raises PlayLogError on the first bad chunk."""
+    header = pd.read_csv(path, nrows=0).columns
+    missing = [col for col in PLAY_COLUMNS if col not in header and col not in OPTIONAL_COLUMNS]
+    if missing:
+        raise PlayLogError(path, [(1, f'missing column(s) {missing}')])
+
+    chunks = []
+    reader = pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunksize)
+    for chunk in reader:
+        plays, problems = check_chunk(chunk)
+        if problems:
+            # +2: the header is line 1 and chunk indexes start at 0
+            raise PlayLogError(path, [(int(chunk.index[offset]) + 2, message) for offset, message in problems[:MAX_ERRORS]])
+        chunks.append(plays)
+    if chunks:
+        plays = pd.concat(chunks)
+    else:
+        plays = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in PLAY_DTYPES.items()})
+    return encode_plays(plays.reset_index(drop=True)[PLAY_COLUMNS])
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+from analytics.drives import compute_drives, drive_points
+from analytics.games import DATA_DIR
+from analytics.loader import memoize
+from analytics.metrics import bool_flags, efficient_mask
+from analytics.season import load_season, play_logs, season_version
+
+# Situation grid: down x ytg bucket x field position band
+DOWNS = 4
+# Upper edges of the 1-3, 4-6 and 7-10 buckets; anything longer is 11+
+YTG_EDGES = np.array([3.0, 6.0, 10.0])
+YTG_BUCKETS = ['1-3', '4-6', '7-10', '11+']
+FIELD_BAND = 10
+BANDS = 10
+SHAPE = (DOWNS, len(YTG_BUCKETS), BANDS)
+
+TOUCHDOWN = 7.0
+
+# Each cell is shrunk toward its field band (and each band toward the season) by this many pseudo-plays
+PRIOR_WEIGHT = 10
+
+VALUE_COLUMNS = ['ep', 'epa', 'success', 'expected_success']
+
+
+def ytg_bucket(ytg):
+    """Position in YTG_BUCKETS of each distance."""
+    return np.searchsorted(YTG_EDGES, np.asarray(ytg, dtype=float))
+
+
+def field_band(field_pos):
+    """10-yd band of each spot, 0 (own 0-9) to 9 (opponent's 10 to the goal line)."""
+    return np.clip(np.asarray(field_pos, dtype=int) // FIELD_BAND, 0, BANDS - 1)
+
+
+def situation_index(down, ytg, field_pos):
+    """Flat index into the situation grid, vectorized over plays."""
+    down = np.clip(np.asarray(down, dtype=int) - 1, 0, DOWNS - 1)
+    return (down * len(YTG_BUCKETS) + ytg_bucket(ytg)) * BANDS + field_band(field_pos)
+
+
+def _shrink(sums, counts, prior):
+    return (sums + PRIOR_WEIGHT * prior) / (counts + PRIOR_WEIGHT)
+
+
+def _fit(idx, outcome):
+    # Cell rates shrunk toward their field band, bands toward the overall rate
+    cells = np.prod(SHAPE)
+    counts = np.bincount(idx, minlength=cells)
+    sums = np.bincount(idx, weights=outcome, minlength=cells)
+    overall = sums.sum() / counts.sum() if counts.sum() else 0.0
+    band_counts = counts.reshape(-1, BANDS).sum(axis=0)
+    band_sums = sums.reshape(-1, BANDS).sum(axis=0)
+    band = _shrink(band_sums, band_counts, overall)
+    return _shrink(sums, counts, np.tile(band, cells // BANDS)).reshape(SHAPE).astype('float32')
+
+
+def fit_value_model(plays):
+    """Success rate and expected points for every (down, ytg bucket, field band) from a play table.
+
+    Success is the efficient movement rule. Expected points are the average points scored by
+    the drives that went through the situation.
+    """
+    idx = situation_index(plays['down'], plays['ytg'], plays['field_pos'])
+    return {
+        'success': _fit(idx, efficient_mask(plays).astype(float)),
+        'ep': _fit(idx, drive_points(compute_drives(plays))),
+        'plays': np.bincount(idx, minlength=np.prod(SHAPE)).reshape(SHAPE).astype('int32'),
+    }
+
+
+def play_values(plays, model):
+    """Per-play expected points before the snap, EPA, success and situational success rate."""
+    down = plays['down'].to_numpy(dtype=int)
+    ytg = plays['ytg'].to_numpy(dtype=float)
+    field_pos = plays['field_pos'].to_numpy(dtype=int)
+    yds = plays['yds'].fillna(0).to_numpy(dtype=float)
+    converted = bool_flags(plays, 'converted')
+    ep = model['ep'].ravel()
+    idx = situation_index(down, ytg, field_pos)
+
+    # Next snap: first down on a conversion, otherwise the next down with the remaining distance
+    new_pos = field_pos + yds
+    next_down = np.where(converted, 1, down + 1)
+    next_ytg = np.where(converted, np.minimum(10.0, 100 - new_pos), ytg - yds)
+    ep_after = ep[situation_index(next_down, np.maximum(next_ytg, 1.0), new_pos)]
+    # Turnover on downs hands the opponent a first down at the spot
+    ep_after = np.where(next_down > DOWNS, -ep[situation_index(1, 10.0, 100 - new_pos)], ep_after)
+    ep_after = np.where(new_pos >= 100, TOUCHDOWN, ep_after)
+
+    return pd.DataFrame({
+        'ep': ep[idx],
+        'epa': ep_after - ep[idx],
+        'success': efficient_mask(plays),
+        'expected_success': model['success'].ravel()[idx],
+    }, index=plays.index)
+
+
+def load_value_model(data_dir=DATA_DIR):
+    """Season value model plus per-play values aligned with the season play table."""
+    def build():
+        plays = load_season(data_dir)['plays']
+        model = fit_value_model(plays)
+        model['values'] = play_values(plays, model)
+        model['values'].insert(0, 'game', plays['game'])
+        return model
+
+    # Refit when any log changes
+    return memoize(('value_model', data_dir), season_version(play_logs(data_dir)), build)
+
+
+def game_values(game, data_dir=DATA_DIR):
+    """Per-play values for one game, indexed like its play log."""
+    values = load_value_model(data_dir)['values']
+    return values.loc[values['game'] == game, VALUE_COLUMNS].reset_index(drop=True)
+
+
+def season_values(data_dir=DATA_DIR):
+    """Games x (epa per play, success rate)."""
+    values = load_value_model(data_dir)['values']
+    grouped = values.groupby('game', observed=True, sort=False)
+    return pd.DataFrame({'epa_per_play': grouped['epa'].mean(), 'success_rate': grouped['success'].mean()})
@@ -0,0 +1,97 @@
+import concurrent.futures
+import os
+import threading
+import time
+
+from analytics.bootstrap import load_player_intervals, load_team_intervals
+from analytics.charts import create_semi_circular_gauge, pyplot_png
+from analytics.drives import load_drives
+from analytics.figures import card_gauges, draw_avg_yds, draw_team_graph, draw_yds, yds_charts
+from analytics.games import DATA_DIR, GAMES, has_play_log, play_log
+from analytics.headshots import get_image_as_base64
+from analytics.loader import load_plays
+from analytics.metrics import load_team_metrics
+from analytics.players import load_player_stats
+from analytics.query import load_query_index
+from analytics.roster import starting_qb
+from analytics.season import load_season
+from analytics.series import load_team_series
+from analytics.situations import load_situations
+from analytics.trends import load_player_trends
+from analytics.value import load_value_model
+
+# On by default; GTFA_WARMUP=0 skips it (e.g. for the cli or a quick local run)
+ENV_FLAG = 'GTFA_WARMUP'
+WORKERS = 4
+
+_status = {'total': 0, 'done': 0, 'failed': {}, 'started': None, 'finished': None}
+_status_lock = threading.Lock()
+
+
+def warm_game(path):
+    """Fill every per-game cache a report page reads, with the same arguments the page uses."""
+    plays = load_plays(path)
+    passer = starting_qb()
+    load_team_metrics(path)
+    load_situations(path)
+    load_drives(path)
+    load_team_intervals(path)
+    load_player_intervals(path)
+    pyplot_png(draw_team_graph, load_team_series(path))
+    for player, player_yds, passing_yds in yds_charts(plays, passer):
+        pyplot_png(draw_yds, player_yds, passing_yds, len(plays), player)
+        pyplot_png(draw_avg_yds, player_yds, passing_yds, len(plays), player)
+    for player, stats in load_player_stats(path).items():
+        for _, _, percentage, title, color in card_gauges(stats, player == passer):
+            create_semi_circular_gauge(percentage, title, color)
+        try:
+            get_image_as_base64(player)
+        except FileNotFoundError:
+            pass
+
+
+def warm_season(data_dir=DATA_DIR):
+    load_season(data_dir)
+    load_value_model(data_dir)
+    load_player_trends(data_dir)
+    load_query_index(data_dir)
+
+
+def _run(paths, data_dir, workers):
+    def warm(path):
+        try:
+            warm_game(path)
+        except Exception as e:
+            with _status_lock:
+                _status['failed'][path] = repr(e)
+        with _status_lock:
+            _status['done'] += 1
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='warmup') as pool:
+        list(pool.map(warm, paths))
+    # Season views are built from the per-game caches, so they go last
+    try:
+        warm_season(data_dir)
+    except Exception as e:
+        with _status_lock:
+            _status['failed']['season'] = repr(e)
+    with _status_lock:
+        _status['finished'] = time.time()
+
+
+def start(data_dir=DATA_DIR, workers=WORKERS):
+    """Warm the caches for every scheduled game on a background pool, once per process."""
+    if os.environ.get(ENV_FLAG) == '0':
+        return
+    with _status_lock:
+        if _status['started'] is not None:
+            return
+        paths = [play_log(game, data_dir) for game in GAMES if has_play_log(game, data_dir)]
+        _status.update(total=len(paths), started=time.time())
+    threading.Thread(target=_run, args=(paths, data_dir, workers), name='warmup', daemon=True).start()
+
+
+def status():
+    """Snapshot of the warmup progress; `started` is None if it never ran."""
+    with _status_lock:
+        return {**_status, 'failed': dict(_status['failed'])}
@@ -1,3 +1,3 @@
-import streamlit as st
+from analytics.report import render_game
 
-st.warning('In Progress')
\ No newline at end of file
+render_game('SYR-GT-09-07-24')